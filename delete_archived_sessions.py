@@ -6,6 +6,7 @@ Uses unified Jules client and configuration.
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Import unified configuration and client
 from common_config import setup_logging, setup_python_path
@@ -21,27 +22,27 @@ def delete_archived_sessions():
     client = get_jules_client()
     
     logger.info("Fetching all archived sessions from Jules to delete them...")
-    sessions = client.list_sessions(filter='state="ARCHIVED"')
-    
-    if not sessions:
+
+    # Deletes are independent API calls, so run them concurrently over
+    # the client's pooled connections instead of one RTT at a time.
+    # Consuming iter_sessions() lets deletes start while later pages
+    # are still being fetched.
+    futures = []
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for session in client.iter_sessions(filter='state="ARCHIVED"'):
+            session_name = session.get("name")
+            if session_name:
+                futures.append(
+                    executor.submit(client.delete_session, session_name)
+                )
+
+        deleted_count = sum(1 for future in futures if future.result())
+
+    if not futures:
         logger.info("No archived sessions found to delete.")
         return
-        
-    sessions_to_delete = [session.get("name") for session in sessions if session.get("name")]
-    
-    if not sessions_to_delete:
-        logger.info("No valid session names found to delete.")
-        return
-        
-    logger.info(f"Found {len(sessions_to_delete)} archived sessions to delete.")
-    
-    deleted_count = 0
-    for session_name in sessions_to_delete:
-        success = client.delete_session(session_name)
-        if success:
-            deleted_count += 1
-            
-    logger.info(f"Successfully deleted {deleted_count} of {len(sessions_to_delete)} archived sessions.")
+
+    logger.info(f"Successfully deleted {deleted_count} of {len(futures)} archived sessions.")
 
 
 if __name__ == "__main__":
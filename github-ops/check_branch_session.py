@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import argparse
 import csv
+import functools
 import os
 import sys
 
@@ -12,10 +13,105 @@ try:
 except ImportError:
     JULES_OPS_AVAILABLE = False
 
+# Optional C-level CSV parsers for the cold index build; the stdlib
+# csv path below keeps the CLI working without either installed.
+try:
+    import pyarrow.csv as pa_csv
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import pandas as pd
+
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
 # Default artifact path (assumes script is run from same dir as csv)
 DEFAULT_CSV_PATH = "consolidated_workstreams.csv"
 
 
+@functools.lru_cache(maxsize=4)
+def _load_index(csv_path, mtime):
+    """
+    Parse the workstreams CSV once and build hash indexes for lookups.
+
+    Returns (by_branch, by_pr, by_issue) dicts mapping each key to its
+    first (latest, since the CSV is date-sorted descending) row.
+    The mtime argument exists only to invalidate the cache when the
+    file changes.
+    """
+    by_branch = {}
+    by_pr = {}
+    by_issue = {}
+
+    columns = _read_csv_columns(csv_path)
+    if columns is not None:
+        header = list(columns)
+        for row in zip(*columns.values()):
+            row_dict = dict(zip(header, row))
+            for index, col in zip(
+                (by_branch, by_pr, by_issue), ("branch", "pr_id", "issue_id")
+            ):
+                key = row_dict.get(col)
+                if key and key not in index:
+                    index[key] = row_dict
+        return by_branch, by_pr, by_issue
+
+    # Large read buffer + newline='' lets the csv module handle line
+    # endings itself and pulls the file in big aligned reads.
+    with open(csv_path, "r", buffering=1 << 20, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return by_branch, by_pr, by_issue
+
+        col_idx = {name: i for i, name in enumerate(header)}
+        cols = tuple(
+            col_idx.get(name)
+            for name in ("branch", "pr_id", "issue_id")
+        )
+
+        for row in reader:
+            for index, col in zip((by_branch, by_pr, by_issue), cols):
+                if col is None or col >= len(row):
+                    continue
+                key = row[col]
+                if key and key not in index:
+                    index[key] = dict(zip(header, row))
+
+    return by_branch, by_pr, by_issue
+
+
+def _read_csv_columns(csv_path):
+    """
+    Parse the CSV with a C-level columnar reader if one is installed.
+
+    Returns a dict of column name -> list of string values, or None if
+    neither pyarrow nor pandas is available.
+    """
+    if PYARROW_AVAILABLE:
+        table = pa_csv.read_csv(
+            csv_path,
+            read_options=pa_csv.ReadOptions(block_size=1 << 20),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={}, strings_can_be_null=False
+            ),
+        )
+        return {
+            name: [str(v) if v is not None else "" for v in col.to_pylist()]
+            for name, col in zip(table.column_names, table.columns)
+        }
+
+    if PANDAS_AVAILABLE:
+        df = pd.read_csv(csv_path, dtype=str, engine="c").fillna("")
+        return {name: df[name].tolist() for name in df.columns}
+
+    return None
+
+
 def get_jules_session(query, csv_path=DEFAULT_CSV_PATH):
     """
     Attempts to find the Jules session ID associated with the provided query.
@@ -30,31 +126,43 @@ def get_jules_session(query, csv_path=DEFAULT_CSV_PATH):
     # Normalize query for ID comparison
     query_str = str(query).strip()
 
-    # Create a set of variants to check against ID columns to be flexible
-    query_variants = {query_str}
-    if not query_str.startswith("#"):
-        query_variants.add(f"#{query_str}")
+    # Pre-normalize both ID spellings once; the common case (no '#')
+    # builds the variants without any stripping.
+    if "#" not in query_str:
+        bare = query_str
     else:
-        query_variants.add(query_str[1:])
+        bare = query_str.lstrip("#")
+
+    # Queries that are neither numeric nor '#'-prefixed can only be
+    # branch names; ID-shaped queries (the common CLI case) are most
+    # often PR numbers, so check PRs first for those.
+    is_id_query = query_str.startswith("#") or bare.isdigit()
 
     try:
-        with open(csv_path, "r") as f:
-            reader = csv.DictReader(f)
-            # CSV is assumed to be sorted by date descending,
-            # so first match is "latest"
-            for row in reader:
-                # 1. Check Branch (Exact Match)
-                if row.get("branch") == query_str:
-                    return _extract_session_info(row, "Branch match")
-
-                # 2. Check PR ID (Checks "160" and "#160")
-                if row.get("pr_id") in query_variants:
+        by_branch, by_pr, by_issue = _load_index(
+            csv_path, os.path.getmtime(csv_path)
+        )
+
+        if is_id_query:
+            query_variants = (bare, f"#{bare}")
+
+            # 1. Check PR ID (Checks "160" and "#160")
+            for variant in query_variants:
+                row = by_pr.get(variant)
+                if row is not None:
                     return _extract_session_info(row, "PR ID match")
 
-                # 3. Check Issue ID (Checks "152" and "#152")
-                if row.get("issue_id") in query_variants:
+            # 2. Check Issue ID (Checks "152" and "#152")
+            for variant in query_variants:
+                row = by_issue.get(variant)
+                if row is not None:
                     return _extract_session_info(row, "Issue ID match")
 
+        # 3. Check Branch (Exact Match)
+        row = by_branch.get(query_str)
+        if row is not None:
+            return _extract_session_info(row, "Branch match")
+
     except Exception as e:
         print(f"Error reading workstreams CSV: {e}", file=sys.stderr)
 
@@ -4,66 +4,232 @@ Unified GitHub and Git client for hrm-workspace operations.
 Handles git commands and GitHub CLI interactions.
 """
 
+import io
 import json
 import logging
+import os
 import shutil
 import subprocess
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+import requests
+
+# orjson parses 2-5x faster than stdlib json; fall back silently.
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    _HAS_ORJSON = False
+
+    def _json_loads(data):
+        return json.loads(data)
+
 from common_config import HRM_REPO_DIR, setup_logging
+from response_cache import ResponseCache, get_response_cache
 
 logger = setup_logging("github_client")
 
+# Shared field lists, built once at import instead of per call.
+_PR_GQL_FIELDS = (
+    "number title body headRefName baseRefName headRefOid "
+    "state url reviewDecision"
+)
+_PR_LIST_GQL_FIELDS = (
+    "number title body headRefName baseRefName headRefOid state url "
+    "reviewDecision updatedAt"
+)
+_ISSUE_GQL_FIELDS = (
+    "number title body url assignees(first: 20) { nodes { login } } updatedAt"
+)
+_ISSUE_LIST_GQL_FIELDS = (
+    "number title assignees(first: 20) { nodes { login } } updatedAt url"
+)
+_PR_VIEW_JSON_FIELDS = (
+    "number,title,body,headRefName,baseRefName,headRefOid,state,url,"
+    "reviewDecision"
+)
+_PR_LIST_JSON_FIELDS = (
+    "number,title,body,headRefName,baseRefName,headRefOid,state,url,"
+    "reviewDecision,updatedAt"
+)
+_ISSUE_VIEW_JSON_FIELDS = "number,title,body,url,assignees,updatedAt"
+_ISSUE_LIST_JSON_FIELDS = "number,title,assignees,updatedAt,url"
+
 
 class GitHubClient:
     """Client for interacting with Git and GitHub CLI."""
 
-    def __init__(self, repo_path: Union[str, Path] = HRM_REPO_DIR):
+    def __init__(self, repo_path: Union[str, Path] = HRM_REPO_DIR,
+                 cache_ttl: float = 0):
         self.repo_path = Path(repo_path)
+        # When > 0, read-only GraphQL queries are served from the
+        # shared on-disk cache for this many seconds.
+        self.cache_ttl = cache_ttl
+        # Resolved executable paths, so each run_cmd call doesn't re-walk PATH
+        self._exec_cache: Dict[str, Optional[str]] = {}
+        # Per-process PR memo: list_prs and get_prs_bulk pre-populate it,
+        # so the follow-up get_pr calls a typical batch run makes cost no
+        # extra round trips.
+        self._pr_cache: Dict[int, Dict[str, Any]] = {}
+        # Trimmed child environment: only what git/gh actually need,
+        # which shrinks the per-fork copy for every subprocess.
+        self._child_env = {
+            key: value
+            for key, value in os.environ.items()
+            if key in (
+                "HOME", "PATH", "USER", "LANG", "LC_ALL", "TERM",
+                "GH_TOKEN", "GITHUB_TOKEN", "GH_CONFIG_DIR", "GH_HOST",
+                "SSH_AUTH_SOCK", "XDG_CONFIG_HOME",
+            ) or key.startswith("GIT_")
+        }
         self._check_dependencies()
 
     def _check_dependencies(self):
         """Ensure gh and git are installed."""
-        if not shutil.which("gh"):
+        if not self._resolve_executable("gh"):
             logger.error("❌ GitHub CLI ('gh') is not installed.")
             # We don't exit here to allow library usage, but operations will fail
-        if not shutil.which("git"):
+        if not self._resolve_executable("git"):
             logger.error("❌ Git is not installed.")
 
-    def run_cmd(self, cmd_list: List[str], check: bool = True) -> Optional[str]:
-        """Run a shell command in the repo directory."""
+    def _resolve_executable(self, name: str) -> Optional[str]:
+        """Resolve an executable via PATH, caching the result."""
+        if name not in self._exec_cache:
+            self._exec_cache[name] = shutil.which(name)
+        return self._exec_cache[name]
+
+    def run_cmd(self, cmd_list: List[str], check: bool = True,
+                capture: bool = True) -> Optional[str]:
+        """Run a shell command in the repo directory.
+
+        Returns the command's stdout ("" when capture=False) on success
+        and None on nonzero exit with check=False, so callers can test
+        `is None` to detect failure; with check=True a nonzero exit
+        raises CalledProcessError instead.
+
+        Pass capture=False for side-effect commands whose stdout is
+        discarded; that skips pipe allocation and UTF-8 decoding of
+        output nobody reads (git progress bars in particular).
+        """
         try:
             # Check if command exists before running to avoid FileNotFoundError
-            executable = cmd_list[0]
-            if not shutil.which(executable):
-                 logger.error(f"❌ Executable '{executable}' not found.")
+            executable = self._resolve_executable(cmd_list[0])
+            if not executable:
+                 logger.error(f"❌ Executable '{cmd_list[0]}' not found.")
                  return None
 
+            if capture:
+                result = subprocess.run(
+                    [executable] + cmd_list[1:],
+                    capture_output=True,
+                    text=True,
+                    check=check,
+                    cwd=self.repo_path,
+                    env=self._child_env,
+                )
+                if result.returncode != 0:
+                    logger.debug(f"Command exited {result.returncode}: {' '.join(cmd_list)}")
+                    return None
+                return result.stdout.strip()
+
             result = subprocess.run(
-                cmd_list,
-                capture_output=True,
-                text=True,
+                [executable] + cmd_list[1:],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=check,
                 cwd=self.repo_path,
+                env=self._child_env,
             )
-            return result.stdout.strip()
+            if result.returncode != 0:
+                logger.debug(f"Command exited {result.returncode}: {' '.join(cmd_list)}")
+                return None
+            return ""
         except subprocess.CalledProcessError as e:
+            stderr = e.stderr or b""
+            if isinstance(stderr, bytes):
+                stderr = stderr.decode("utf-8", errors="replace")
             logger.error(f"❌ Command failed: {' '.join(cmd_list)}")
-            logger.error(f"   Error: {e.stderr.strip()}")
+            logger.error(f"   Error: {stderr.strip()}")
             if check:
                 raise
             return None
 
     def run_gh_json(self, cmd_list: List[str]) -> Any:
-        """Run a gh command and parse JSON output."""
+        """Run a gh command and parse JSON output.
+
+        Captures stdout as bytes and hands them straight to the JSON
+        parser (stdlib and orjson both accept bytes), skipping the
+        full UTF-8 decode pass run_cmd's text mode would make.
+        stderr is decoded only on failure.
+        """
+        executable = self._resolve_executable(cmd_list[0])
+        if not executable:
+            logger.error(f"❌ Executable '{cmd_list[0]}' not found.")
+            return None
+
         try:
-            output = self.run_cmd(cmd_list)
-            if output:
-                return json.loads(output)
+            result = subprocess.run(
+                [executable] + cmd_list[1:],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                check=True,
+                cwd=self.repo_path,
+                env=self._child_env,
+            )
+            if result.stdout.strip():
+                return _json_loads(result.stdout)
+            return None
+        except subprocess.CalledProcessError as e:
+            stderr = (e.stderr or b"").decode("utf-8", errors="replace")
+            logger.error(f"❌ Command failed: {' '.join(cmd_list)}")
+            logger.error(f"   Error: {stderr.strip()}")
+            return None
+        except ValueError:
+            return None
+
+    def run_gh_json_stream(self, cmd_list: List[str]) -> Any:
+        """Run a gh command, parsing JSON straight off the pipe.
+
+        json.load reads from the subprocess stdout directly, avoiding
+        the full intermediate str copy that run_cmd makes — worth it
+        for large list responses.
+        """
+        executable = self._resolve_executable(cmd_list[0])
+        if not executable:
+            logger.error(f"❌ Executable '{cmd_list[0]}' not found.")
             return None
-        except (json.JSONDecodeError, subprocess.CalledProcessError):
+
+        try:
+            proc = subprocess.Popen(
+                [executable] + cmd_list[1:],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=self.repo_path,
+                env=self._child_env,
+            )
+            try:
+                if _HAS_ORJSON:
+                    # orjson wants the whole buffer; reading bytes off
+                    # the pipe still skips run_cmd's str copy and the
+                    # parse itself is 2-3x faster.
+                    data = _json_loads(proc.stdout.read())
+                else:
+                    data = json.load(
+                        io.TextIOWrapper(proc.stdout, encoding="utf-8")
+                    )
+            finally:
+                proc.wait()
+            if proc.returncode != 0:
+                logger.error(f"❌ Command failed: {' '.join(cmd_list)}")
+                return None
+            return data
+        except (ValueError, OSError):
             return None
 
     # --- Git Operations ---
@@ -81,7 +247,9 @@ class GitHubClient:
             cmd.append(source)
 
         try:
-            self.run_cmd(cmd)
+            self.run_cmd(cmd, capture=False)
+            if create:
+                self.refresh_refs()
             return True
         except subprocess.CalledProcessError:
             return False
@@ -92,7 +260,7 @@ class GitHubClient:
         if branch:
             cmd.append(branch)
         try:
-            self.run_cmd(cmd)
+            self.run_cmd(cmd, capture=False)
             return True
         except subprocess.CalledProcessError:
             return False
@@ -103,7 +271,7 @@ class GitHubClient:
         if branch:
             cmd.append(branch)
         try:
-            self.run_cmd(cmd)
+            self.run_cmd(cmd, capture=False)
             return True
         except subprocess.CalledProcessError:
             return False
@@ -115,30 +283,50 @@ class GitHubClient:
             cmd.extend(["-m", message])
 
         try:
-            self.run_cmd(cmd)
+            self.run_cmd(cmd, capture=False)
             return True
         except subprocess.CalledProcessError:
             if abort_on_conflict:
                 logger.warning(f"⚠️ Merge conflict with {branch}, aborting...")
-                self.run_cmd(["git", "merge", "--abort"], check=False)
+                self.run_cmd(["git", "merge", "--abort"], check=False, capture=False)
             return False
 
     def fetch(self, remote: str = "origin") -> bool:
         try:
-            self.run_cmd(["git", "fetch", remote])
+            self.run_cmd(["git", "fetch", remote], capture=False)
+            self.refresh_refs()
             return True
         except subprocess.CalledProcessError:
             return False
 
+    def refresh_refs(self) -> None:
+        """Drop the cached ref listing so it is re-read on next use."""
+        self._local_refs = None
+        self._remote_refs = None
+
+    def _load_refs(self) -> None:
+        """List all local and origin refs in one git invocation."""
+        output = self.run_cmd(
+            ["git", "for-each-ref", "--format=%(refname)",
+             "refs/heads/", "refs/remotes/origin/"],
+            check=False,
+        )
+        local, remote = set(), set()
+        for ref in (output or "").splitlines():
+            if ref.startswith("refs/heads/"):
+                local.add(ref[len("refs/heads/"):])
+            elif ref.startswith("refs/remotes/origin/"):
+                remote.add(ref[len("refs/remotes/origin/"):])
+        self._local_refs = frozenset(local)
+        self._remote_refs = frozenset(remote)
+
     def branch_exists(self, branch: str, remote: bool = False) -> bool:
-        cmd = ["git", "show-ref", "--verify", "--quiet"]
-        ref = f"refs/remotes/origin/{branch}" if remote else f"refs/heads/{branch}"
-        cmd.append(ref)
-        try:
-            self.run_cmd(cmd)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+        # One for-each-ref listing serves every subsequent check; scripts
+        # probing many branches pay a single fork instead of N.
+        if getattr(self, "_local_refs", None) is None:
+            self._load_refs()
+        refs = self._remote_refs if remote else self._local_refs
+        return branch in refs
 
     def get_file_content(self, branch: str, filepath: str) -> Optional[str]:
         """Fetch the content of a file at a specific branch/revision."""
@@ -148,12 +336,19 @@ class GitHubClient:
             logger.warning(f"Failed to fetch content for {filepath} at {branch}")
             return None
 
-    def get_diff(self, base: str, head: str, filepath: str) -> Optional[str]:
-        """Fetch the diff for a file between two revisions."""
+    def get_diff(self, base: str, head: str,
+                 filepath: Optional[str] = None) -> Optional[str]:
+        """Fetch the diff between two revisions, optionally for one file."""
+        cmd = ["git", "diff", f"{base}...{head}"]
+        if filepath:
+            cmd += ["--", filepath]
         try:
-            return self.run_cmd(["git", "diff", f"{base}...{head}", "--", filepath])
+            return self.run_cmd(cmd)
         except subprocess.CalledProcessError:
-            logger.warning(f"Failed to fetch diff for {filepath} between {base} and {head}")
+            logger.warning(
+                f"Failed to fetch diff for {filepath or 'PR'} "
+                f"between {base} and {head}"
+            )
             return None
 
     def get_changed_files(self, base: str, head: str) -> List[str]:
@@ -167,13 +362,243 @@ class GitHubClient:
 
     # --- GitHub Operations ---
 
-    def get_pr(self, number: int) -> Optional[Dict[str, Any]]:
-        return self.run_gh_json(
-            ["gh", "pr", "view", str(number), "--json", "number,title,body,headRefName,baseRefName,headRefOid,state,url,reviewDecision"]
+    def _gh_token(self) -> Optional[str]:
+        """Fetch and cache the GitHub auth token from the gh CLI."""
+        if not hasattr(self, "_token"):
+            self._token = self.run_cmd(["gh", "auth", "token"], check=False)
+        return self._token
+
+    @property
+    def http(self) -> Optional[requests.Session]:
+        """Pooled HTTPS session for direct GitHub API calls.
+
+        Returns None if no token is available, in which case callers
+        fall back to gh subprocesses.
+        """
+        if not hasattr(self, "_http"):
+            token = self._gh_token()
+            if not token:
+                self._http = None
+            else:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_maxsize=16)
+                session.mount("https://", adapter)
+                session.headers.update({
+                    "Authorization": f"Bearer {token}",
+                    "Accept": "application/vnd.github+json",
+                })
+                self._http = session
+        return self._http
+
+    def _graphql(self, query: str, variables: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+        """POST a GraphQL query over the pooled session.
+
+        Falls back to a gh subprocess when no direct session is
+        available. Returns the 'data' payload or None.
+        """
+        # Only pure queries are cacheable; mutations must always run.
+        cache_key = None
+        if self.cache_ttl > 0 and query.lstrip().startswith("query"):
+            cache_key = ResponseCache.make_key("github", query, variables)
+            cached = get_response_cache().get(cache_key)
+            if cached is not None:
+                logger.debug("Disk cache hit for GraphQL query")
+                return cached
+
+        data = self._graphql_uncached(query, variables)
+
+        if data is not None and cache_key is not None:
+            get_response_cache().set(cache_key, data, ttl=self.cache_ttl)
+
+        return data
+
+    def _graphql_uncached(self, query: str, variables: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+        """Network half of _graphql."""
+        if self.http is not None:
+            try:
+                response = self.http.post(
+                    "https://api.github.com/graphql",
+                    json={"query": query, "variables": variables or {}},
+                    timeout=30,
+                )
+                response.raise_for_status()
+
+                # Direct HTTP exposes rate-limit headers the gh CLI
+                # hides; surface them before we start getting 403s.
+                remaining = response.headers.get("X-RateLimit-Remaining")
+                if remaining is not None and int(remaining) < 100:
+                    logger.warning(
+                        f"GitHub API rate limit low: {remaining} requests "
+                        "remaining"
+                    )
+
+                payload = response.json()
+                if payload.get("errors"):
+                    logger.error(f"GraphQL errors: {payload['errors']}")
+                    return None
+                return payload.get("data")
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Direct GraphQL request failed: {e}")
+
+        cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
+        if variables:
+            for key, value in variables.items():
+                flag = "-F" if isinstance(value, (int, bool)) else "-f"
+                cmd.extend([flag, f"{key}={value}"])
+        response = self.run_gh_json(cmd)
+        return response.get("data") if response else None
+
+    def _name_with_owner(self) -> Optional[str]:
+        """Resolve and cache the 'owner/repo' slug for the current repo."""
+        if not hasattr(self, "_repo_slug"):
+            self._repo_slug = self.run_cmd(
+                ["gh", "repo", "view", "--json", "nameWithOwner",
+                 "-q", ".nameWithOwner"],
+                check=False,
+            )
+        return self._repo_slug
+
+    def get_prs_bulk(self, numbers: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Fetch many PRs in a single GraphQL round trip.
+
+        Returns a dict mapping PR number to its details; numbers that
+        don't resolve are omitted.
+        """
+        return self._get_items_bulk(numbers, "pullRequest")
+
+    def get_issues_bulk(self, numbers: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Fetch many issues in a single GraphQL round trip."""
+        return self._get_items_bulk(numbers, "issue")
+
+    def _get_items_bulk(self, numbers: List[int], field: str) -> Dict[int, Dict[str, Any]]:
+        """Shared GraphQL batcher behind get_prs_bulk/get_issues_bulk."""
+        if not numbers:
+            return {}
+
+        slug = self._name_with_owner()
+        if not slug:
+            logger.error("Could not resolve repository for bulk fetch")
+            return {}
+
+        owner, repo = slug.split("/", 1)
+        subfields = (
+            "number title body state url"
+            if field == "issue"
+            else _PR_GQL_FIELDS
+        )
+        aliases = " ".join(
+            f"item{n}: {field}(number: {n}) {{ {subfields} }}"
+            for n in numbers
+        )
+        query = (
+            f'query {{ repository(owner: "{owner}", name: "{repo}") '
+            f"{{ {aliases} }} }}"
         )
 
+        data = self._graphql(query)
+        if not data:
+            return {}
+
+        repository = data.get("repository", {}) or {}
+        items = {
+            item["number"]: item
+            for item in repository.values()
+            if item and "number" in item
+        }
+        if field == "pullRequest":
+            self._pr_cache.update(items)
+        return items
+
+    @staticmethod
+    def _pr_states(state: str) -> str:
+        """Map a gh-style state filter onto GraphQL PullRequestState."""
+        return {
+            "open": "states: [OPEN], ",
+            "closed": "states: [CLOSED, MERGED], ",
+        }.get(state, "")
+
+    @staticmethod
+    def _flatten_assignees(item: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert GraphQL assignee connections to the gh CLI shape."""
+        assignees = item.get("assignees")
+        if isinstance(assignees, dict):
+            item["assignees"] = assignees.get("nodes", [])
+        return item
+
+    def get_pr(self, number: int) -> Optional[Dict[str, Any]]:
+        cached = self._pr_cache.get(number)
+        if cached is not None:
+            return cached
+
+        slug = self._name_with_owner()
+        pr = None
+        if slug:
+            owner, repo = slug.split("/", 1)
+            data = self._graphql(
+                f'query {{ repository(owner: "{owner}", name: "{repo}") {{ '
+                f"pullRequest(number: {number}) "
+                f"{{ {_PR_GQL_FIELDS} }} }} }}"
+            )
+            if data:
+                pr = data.get("repository", {}).get("pullRequest")
+
+        if pr is None:
+            pr = self.run_gh_json(
+                ["gh", "pr", "view", str(number), "--json",
+                 _PR_VIEW_JSON_FIELDS]
+            )
+        if pr:
+            self._pr_cache[number] = pr
+        return pr
+
+    def _paginate_nodes(self, owner: str, repo: str, connection: str,
+                        filters: str, subfields: str,
+                        limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Walk a GraphQL connection with server-side cursors.
+
+        Fetches up to `limit` nodes in pages of 100, so large result
+        sets cost ceil(limit/100) round trips on one keep-alive
+        session rather than many small list calls.
+        """
+        nodes: List[Dict[str, Any]] = []
+        cursor = None
+
+        while len(nodes) < limit:
+            page_size = min(100, limit - len(nodes))
+            after = f'after: "{cursor}", ' if cursor else ""
+            data = self._graphql(
+                f'query {{ repository(owner: "{owner}", name: "{repo}") {{ '
+                f"{connection}(first: {page_size}, {after}{filters}"
+                "orderBy: {field: CREATED_AT, direction: DESC}) { "
+                "pageInfo { hasNextPage endCursor } "
+                f"nodes {{ {subfields} }} }} }} }}"
+            )
+            if not data:
+                return nodes or None
+
+            connection_data = data.get("repository", {}).get(connection, {})
+            nodes.extend(connection_data.get("nodes", []))
+
+            page_info = connection_data.get("pageInfo", {})
+            if not page_info.get("hasNextPage"):
+                break
+            cursor = page_info.get("endCursor")
+
+        return nodes
+
     def list_prs(self, state: str = "open", limit: int = 100) -> List[Dict[str, Any]]:
-        return self.run_gh_json(
+        slug = self._name_with_owner()
+        if slug:
+            owner, repo = slug.split("/", 1)
+            nodes = self._paginate_nodes(
+                owner, repo, "pullRequests", self._pr_states(state),
+                _PR_LIST_GQL_FIELDS,
+                limit,
+            )
+            if nodes is not None:
+                return self._remember_prs(nodes)
+
+        return self._remember_prs(self.run_gh_json_stream(
             [
                 "gh",
                 "pr",
@@ -183,17 +608,49 @@ class GitHubClient:
                 "--limit",
                 str(limit),
                 "--json",
-                "number,title,headRefName,baseRefName,headRefOid,state,url,reviewDecision,updatedAt",
+                _PR_LIST_JSON_FIELDS,
             ]
-        ) or []
+        ) or [])
+
+    def _remember_prs(self, prs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Seed the PR memo from a list result."""
+        for pr in prs:
+            if pr and "number" in pr:
+                self._pr_cache[pr["number"]] = pr
+        return prs
 
     def get_issue(self, number: int) -> Optional[Dict[str, Any]]:
+        slug = self._name_with_owner()
+        if slug:
+            owner, repo = slug.split("/", 1)
+            data = self._graphql(
+                f'query {{ repository(owner: "{owner}", name: "{repo}") {{ '
+                f"issue(number: {number}) {{ {_ISSUE_GQL_FIELDS} }} }} }}"
+            )
+            if data:
+                issue = data.get("repository", {}).get("issue")
+                return self._flatten_assignees(issue) if issue else None
+
         return self.run_gh_json(
-            ["gh", "issue", "view", str(number), "--json", "number,title,body,url,assignees,updatedAt"]
+            ["gh", "issue", "view", str(number), "--json", _ISSUE_VIEW_JSON_FIELDS]
         )
 
     def list_issues(self, state: str = "open", limit: int = 100) -> List[Dict[str, Any]]:
-        return self.run_gh_json(
+        slug = self._name_with_owner()
+        if slug:
+            owner, repo = slug.split("/", 1)
+            states = "states: [OPEN], " if state == "open" else (
+                "states: [CLOSED], " if state == "closed" else ""
+            )
+            nodes = self._paginate_nodes(
+                owner, repo, "issues", states,
+                _ISSUE_LIST_GQL_FIELDS,
+                limit,
+            )
+            if nodes is not None:
+                return [self._flatten_assignees(issue) for issue in nodes]
+
+        return self.run_gh_json_stream(
             [
                 "gh",
                 "issue",
@@ -203,10 +660,45 @@ class GitHubClient:
                 "--limit",
                 str(limit),
                 "--json",
-                "number,title,assignees,updatedAt,url",
+                _ISSUE_LIST_JSON_FIELDS,
             ]
         ) or []
 
+    def list_open_items(self, limit: int = 100) -> tuple:
+        """Fetch open issues and open PRs in one GraphQL round trip.
+
+        The dashboard needs both lists on every refresh; asking for
+        the two connections in a single query halves the network RTT
+        (and, on the subprocess fallback path, the gh startups).
+        Returns an (issues, prs) tuple.
+        """
+        slug = self._name_with_owner()
+        if slug:
+            owner, repo = slug.split("/", 1)
+            first = min(100, limit)
+            data = self._graphql(
+                f'query {{ repository(owner: "{owner}", name: "{repo}") {{ '
+                f"issues(first: {first}, states: [OPEN], "
+                "orderBy: {field: CREATED_AT, direction: DESC}) { "
+                f"nodes {{ {_ISSUE_LIST_GQL_FIELDS} }} }} "
+                f"pullRequests(first: {first}, states: [OPEN], "
+                "orderBy: {field: CREATED_AT, direction: DESC}) { "
+                f"nodes {{ {_PR_LIST_GQL_FIELDS} }} }} }} }}"
+            )
+            if data:
+                repository = data.get("repository", {})
+                issues = [
+                    self._flatten_assignees(issue)
+                    for issue in repository.get("issues", {}).get("nodes", [])
+                ]
+                prs = repository.get("pullRequests", {}).get("nodes", [])
+                return issues, prs
+
+        return (
+            self.list_issues(state="open", limit=limit),
+            self.list_prs(state="open", limit=limit),
+        )
+
     def post_pr_comment(self, pr_number: int, body: str) -> bool:
         """Post a comment on a Pull Request."""
         try:
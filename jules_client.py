@@ -5,11 +5,28 @@ Consolidates all Jules API interactions with consistent error handling.
 """
 
 import os
+import queue
+import random
 import sys
+import threading
 import time
 import requests
-from typing import Optional, Dict, List, Any
+from requests.adapters import Retry
+from typing import Iterator, Optional, Dict, List, Any
+
+# orjson parses 2-5x faster than stdlib json; fall back silently.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    import json
+
+    def _loads(data):
+        return json.loads(data)
 from common_config import setup_logging, JULES_API_BASE_URL, JULES_DEFAULT_SOURCE
+from response_cache import ResponseCache, get_response_cache
 
 logger = setup_logging("jules_client")
 
@@ -17,8 +34,12 @@ logger = setup_logging("jules_client")
 class JulesClient:
     """Unified client for interacting with the Jules API."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache_ttl: float = 0):
         self.api_key = api_key or os.environ.get("JULES_API_KEY")
+        # When > 0, GET responses are served from the shared on-disk
+        # cache for this many seconds. Off by default so polling flows
+        # (monitor_session) always see fresh state.
+        self.cache_ttl = cache_ttl
         
         if not self.api_key:
             logger.error(
@@ -28,26 +49,122 @@ class JulesClient:
             sys.exit(1)
         
         self.session = requests.Session()
+        # Pooled connections so concurrent callers reuse keep-alive
+        # sockets instead of paying a TLS handshake per request, with
+        # urllib3-level retries for throttling and transient 5xx.
+        # Status-based retries are limited to idempotent methods: a 5xx
+        # on a POST may arrive after the server already processed it, and
+        # replaying create_session/send_message would duplicate work.
+        # POSTs only retry errors where no request reached the server.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=5,
+                connect=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "DELETE"],
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "Content-Type": "application/json",
             "X-Goog-Api-Key": self.api_key,
+            # Explicit so large list responses arrive compressed even if
+            # requests' defaults change; br needs the brotli package.
+            "Accept-Encoding": "gzip, br",
         })
-        
-    def _request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
+        # ETag cache for GET endpoints: (endpoint, params) -> (etag, body).
+        # Conditional requests turn unchanged polls into empty 304s.
+        self._etag_cache: Dict[Any, tuple] = {}
+        # Sources are effectively static within a process; cache per
+        # filter so repeated create_session calls resolve them once.
+        self._sources_cache: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        self._logged_encoding = False
+
+    def _delete(self, endpoint: str) -> bool:
+        """Issue a DELETE and check the status code directly.
+
+        Bulk deletes don't need a response body, so this skips
+        raise_for_status/JSON parsing and the per-call error-dict
+        allocation of _request. 404 counts as success (already gone).
+        """
+        url = f"{JULES_API_BASE_URL}/{endpoint}"
+
+        try:
+            response = self.session.request("DELETE", url, timeout=(5, 30))
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request failed for {endpoint}: {e}")
+            return False
+
+        if response.ok:
+            return True
+        if response.status_code == 404:
+            logger.debug(f"Resource not found (404): {endpoint}")
+            return True
+
+        logger.error(f"HTTP Error {response.status_code}: {response.text}")
+        return False
+
+    def _request(self, method: str, endpoint: str, data: Optional[Dict] = None,
                 params: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
         """Make a request to the Jules API with consistent error handling."""
         url = f"{JULES_API_BASE_URL}/{endpoint}"
-        
+
+        disk_key = None
+        if method == "GET" and self.cache_ttl > 0:
+            disk_key = ResponseCache.make_key("jules", endpoint, params)
+            cached_body = get_response_cache().get(disk_key)
+            if cached_body is not None:
+                logger.debug(f"Disk cache hit: {endpoint}")
+                return cached_body
+
+        cache_key = None
+        headers = None
+        if method == "GET":
+            cache_key = (endpoint, frozenset((params or {}).items()))
+            cached = self._etag_cache.get(cache_key)
+            if cached:
+                headers = {"If-None-Match": cached[0]}
+
         try:
+            # Separate connect/read timeouts: fail fast on dead
+            # networks without cutting off slow-but-alive responses.
             response = self.session.request(
-                method, url, json=data, params=params, timeout=30
+                method, url, json=data, params=params, headers=headers,
+                timeout=(5, 30)
             )
+
+            if not self._logged_encoding:
+                self._logged_encoding = True
+                logger.debug(
+                    "Response Content-Encoding: "
+                    f"{response.headers.get('Content-Encoding', 'identity')}"
+                )
+
+            if response.status_code == 304 and cache_key is not None:
+                logger.debug(f"Not modified (304), using cached body: {endpoint}")
+                return self._etag_cache[cache_key][1]
+
             response.raise_for_status()
-            
-            if response.status_code == 204 or not response.content:
+
+            content = response.content
+            if response.status_code == 204 or not content:
                 return {}
-            
-            return response.json()
+
+            body = _loads(content)
+
+            if cache_key is not None:
+                etag = response.headers.get("ETag")
+                if etag:
+                    self._etag_cache[cache_key] = (etag, body)
+
+            if disk_key is not None:
+                get_response_cache().set(disk_key, body, ttl=self.cache_ttl)
+
+            return body
             
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
@@ -67,43 +184,90 @@ class JulesClient:
             
     def list_sources(self, filter_str: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get list of available sources."""
+        cached = self._sources_cache.get(filter_str)
+        if cached is not None:
+            return cached
+
         endpoint = "sources"
         if filter_str:
             endpoint += f"?filter={filter_str}"
-            
+
         response = self._request("GET", endpoint)
-        return response.get("sources", []) if response and "error" not in response else []
+        sources = response.get("sources", []) if response and "error" not in response else []
+        if sources:
+            # Don't cache failures/empty results so a transient error
+            # isn't pinned for the rest of the process.
+            self._sources_cache[filter_str] = sources
+        return sources
         
-    def list_sessions(self, filter: Optional[str] = None, page_size: int = 100) -> List[Dict[str, Any]]:
+    def list_sessions(self, filter: Optional[str] = None, page_size: int = 200) -> List[Dict[str, Any]]:
         """Get all sessions with pagination."""
-        all_sessions = []
-        next_page_token = None
-        
-        while True:
-            endpoint = "sessions"
-            params = {"pageSize": page_size}
+        all_sessions = list(self.iter_sessions(filter=filter, page_size=page_size))
+        logger.info(f"Retrieved {len(all_sessions)} total sessions")
+        return all_sessions
 
-            if filter:
-                params["filter"] = filter
+    def iter_sessions(self, filter: Optional[str] = None, page_size: int = 200) -> Iterator[Dict[str, Any]]:
+        """Yield sessions as pages arrive, prefetching the next page.
 
-            if next_page_token:
-                params["pageToken"] = next_page_token
-                
-            response = self._request("GET", endpoint, params=params)
-            
-            if not response or "error" in response:
-                logger.warning(f"Failed to fetch sessions page: {response}")
-                break
-                
-            sessions = response.get("sessions", [])
-            all_sessions.extend(sessions)
-            
-            next_page_token = response.get("nextPageToken")
-            if not next_page_token:
+        A background thread fetches pages into a small bounded queue so
+        callers can process page N while page N+1 is in flight.
+        """
+        pages: queue.Queue = queue.Queue(maxsize=2)
+        sentinel = object()
+
+        def fetch_pages():
+            next_page_token = None
+            retries = 0
+            while True:
+                params = {"pageSize": page_size}
+
+                if filter:
+                    params["filter"] = filter
+
+                if next_page_token:
+                    params["pageToken"] = next_page_token
+
+                response = self._request("GET", "sessions", params=params)
+
+                if not response or "error" in response:
+                    # Transient failures get exponential backoff before
+                    # the page is retried; give up after a few attempts.
+                    if (
+                        response
+                        and response.get("error") in ("timeout", "request_failed")
+                        and retries < 3
+                    ):
+                        delay = min(60, 2 * 2 ** retries)
+                        retries += 1
+                        logger.warning(
+                            f"Sessions page fetch failed ({response.get('error')}), "
+                            f"retrying in {delay}s..."
+                        )
+                        time.sleep(delay)
+                        continue
+                    logger.warning(f"Failed to fetch sessions page: {response}")
+                    break
+
+                retries = 0
+
+                pages.put(response.get("sessions", []))
+
+                next_page_token = response.get("nextPageToken")
+                if not next_page_token:
+                    break
+
+            pages.put(sentinel)
+
+        fetcher = threading.Thread(target=fetch_pages, daemon=True)
+        fetcher.start()
+
+        while True:
+            page = pages.get()
+            if page is sentinel:
                 break
-                
-        logger.info(f"Retrieved {len(all_sessions)} total sessions")
-        return all_sessions
+            yield from page
+
+        fetcher.join()
         
     def get_session(self, session_name: str) -> Optional[Dict[str, Any]]:
         """Get details for a specific session."""
@@ -166,48 +330,63 @@ class JulesClient:
     def delete_session(self, session_name: str) -> bool:
         """Delete a session."""
         logger.info(f"🗑️ Deleting session: {session_name}")
-        response = self._request("DELETE", f"sessions/{session_name}")
-        
-        success = response is not None and response.get("error") != "http_error"
+        success = self._delete(f"sessions/{session_name}")
+
         if success:
             logger.debug(f"Successfully deleted session: {session_name}")
-        elif response and response.get("status_code") == 404:
-            logger.debug(f"Session already deleted or not found: {session_name}")
-            success = True  # Consider 404 as success for deletion
         else:
             logger.error(f"Failed to delete session: {session_name}")
-            
+
         return success
         
-    def monitor_session(self, session_name: str, timeout_minutes: int = 30) -> bool:
+    def monitor_session(self, session_name: str, timeout_minutes: int = 30,
+                        initial_interval: float = 2.0,
+                        max_interval: float = 30.0) -> bool:
         """Monitor a session until completion."""
         logger.info(f"👀 Monitoring session: {session_name}")
         end_time = time.time() + (timeout_minutes * 60)
-        
+
+        # Exponential backoff: poll fast right after a state change (short
+        # sessions finish quickly), back off toward max_interval for long
+        # ones. Errors back off on their own, steeper schedule so an API
+        # outage isn't hammered.
+        delay = initial_interval
+        err_streak = 0
+        last_state = None
+
         while time.time() < end_time:
             status = self.get_session(session_name)
             if not status:
-                logger.warning("Could not fetch session status, retrying...")
-                time.sleep(30)
+                err_delay = min(60.0, 5.0 * 2 ** err_streak)
+                err_streak += 1
+                logger.warning(
+                    f"Could not fetch session status, retrying in {err_delay:.0f}s..."
+                )
+                time.sleep(err_delay + random.uniform(0, 0.5))
                 continue
-                
+
+            err_streak = 0
             state = status.get("state", "UNKNOWN")
-            
+
             if state == "SUCCEEDED":
                 logger.info("✅ Session completed successfully")
                 self._print_pr_link(status)
                 return True
-                
+
             elif state in ["FAILED", "CANCELLED", "TERMINATED"]:
                 logger.error(f"❌ Session ended with state: {state}")
                 if "error" in status:
                     logger.error(f"Error details: {status['error']}")
                 return False
-                
+
             else:
-                logger.info(f"⏳ Status: {state}, waiting 30s...")
-                time.sleep(30)
-                
+                if state != last_state:
+                    delay = initial_interval
+                    last_state = state
+                logger.info(f"⏳ Status: {state}, waiting {delay:.1f}s...")
+                time.sleep(delay + random.uniform(0, 0.5))
+                delay = min(max_interval, delay * 1.5)
+
         logger.error("⏱️ Monitoring timed out")
         return False
         
@@ -226,6 +405,7 @@ class JulesClient:
         logger.warning("Session succeeded but no PR URL found in outputs")
 
 
-def get_jules_client(api_key: Optional[str] = None) -> JulesClient:
+def get_jules_client(api_key: Optional[str] = None,
+                     cache_ttl: float = 0) -> JulesClient:
     """Factory function to get a Jules client instance."""
-    return JulesClient(api_key)
\ No newline at end of file
+    return JulesClient(api_key, cache_ttl=cache_ttl)
\ No newline at end of file
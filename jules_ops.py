@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 import argparse
 import csv
+import functools
+import io
 import json
+import operator
 import os
 import re
 import shutil
@@ -9,6 +12,8 @@ import subprocess
 import sys
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime, timezone
 
 # Import unified configuration and client
@@ -19,16 +24,36 @@ from common_config import (
 from jules_client import get_jules_client
 from github_client import GitHubClient
 
-# Optional Pandas Import
+# orjson serializes (and natively handles dataclasses) several times
+# faster than stdlib json; fall back silently.
 try:
-    import pandas as pd
-    HAS_PANDAS = True
+    import orjson
+    _HAS_ORJSON = True
 except ImportError:
-    HAS_PANDAS = False
+    _HAS_ORJSON = False
 
-# Setup
+# Optional Pandas Import — detected here but loaded lazily, so the
+# commands that never touch the correlate/dashboard paths (watch,
+# message, delete, ...) skip the pandas+numpy import at startup.
+from importlib.util import find_spec
+
+HAS_PANDAS = find_spec("pandas") is not None
+np = None
+pd = None
+
+
+def _load_pandas():
+    """Import pandas/numpy on first use and bind the module globals."""
+    global np, pd
+    if pd is None:
+        import numpy
+        import pandas
+        np = numpy
+        pd = pandas
+
+# Setup (workspace validation is deferred to main() so --help and
+# library imports don't require the hrm checkout to be present)
 setup_python_path()
-ensure_workspace()
 logger = setup_logging("jules_ops", level=logging.INFO)
 
 # Backward compatibility
@@ -43,6 +68,7 @@ DEFAULT_SOURCE = JULES_DEFAULT_SOURCE
 # Initialized GitHub Client
 gh_client = GitHubClient(repo_path=HRM_REPO_DIR)
 
+@functools.lru_cache(maxsize=256)
 def fetch_issue_context(issue_number):
     logger.info(f"📥 Fetching context from Issue #{issue_number}...")
     data = gh_client.get_issue(issue_number)
@@ -59,27 +85,41 @@ def fetch_issue_context(issue_number):
     return None
 
 
-def format_time(iso_str):
-    """Converts ISO string to granular relative time."""
+@functools.lru_cache(maxsize=4096)
+def _iso_to_epoch(iso_str):
+    """Parse an ISO timestamp to epoch seconds, cached since the same
+    timestamps recur across render passes."""
+    return datetime.fromisoformat(iso_str.replace("Z", "+00:00")).timestamp()
+
+
+def format_time(iso_str, now=None):
+    """Converts ISO string to granular relative time.
+
+    Pass now=time.time() once per render loop to avoid re-reading the
+    clock (and re-parsing timestamps) for every row.
+    """
     if not iso_str:
         return ""
     try:
-        dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
-        delta = datetime.now(dt.tzinfo) - dt
-        if delta.days > 365:
-            return f"{delta.days // 365}y ago"
-        if delta.days > 0:
-            return f"{delta.days}d ago"
-        hours = delta.seconds // 3600
+        delta_s = (now if now is not None else time.time()) - _iso_to_epoch(
+            iso_str
+        )
+        days = int(delta_s // 86400)
+        if days > 365:
+            return f"{days // 365}y ago"
+        if days > 0:
+            return f"{days}d ago"
+        seconds = delta_s - days * 86400
+        hours = int(seconds // 3600)
         if hours > 0:
             return f"{hours}h ago"
-        minutes = (delta.seconds % 3600) // 60
+        minutes = int(seconds % 3600) // 60
         return f"{minutes}m ago"
     except ValueError:
         return iso_str
 
 
-def get_state_icon(state, created_at_iso):
+def get_state_icon(state, created_at_iso, now=None):
     """Returns an icon based on state and staleness."""
     if state == "SUCCEEDED":
         return "✅"
@@ -89,9 +129,10 @@ def get_state_icon(state, created_at_iso):
     # Check for stale running sessions (> 24 hours)
     if state == "RUNNING":
         try:
-            dt = datetime.fromisoformat(created_at_iso.replace("Z", "+00:00"))
-            delta = datetime.now(dt.tzinfo) - dt
-            if delta.days >= 1:
+            delta_s = (
+                now if now is not None else time.time()
+            ) - _iso_to_epoch(created_at_iso)
+            if delta_s >= 86400:
                 return "🐢"  # Stale/Slow
         except Exception:
             pass
@@ -105,19 +146,78 @@ def get_state_icon(state, created_at_iso):
 # -------------------------------------------------------------------------
 
 
+# Compiled once; extract_issue_id runs per session/PR in correlate_data.
+_ISSUE_HASH_RE = re.compile(r"#(\d+)")
+_ISSUE_KW_RE = re.compile(r"issue[-/](\d+)", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
 def extract_issue_id(text):
-    """Heuristic to find Issue ID in branches/titles."""
+    """Heuristic to find Issue ID in branches/titles.
+
+    Memoized: the same branch names and titles pass through
+    correlate_data several times per refresh.
+    """
     if not text:
         return None
-    match = re.search(r"#(\d+)", text)
+    # Cheap substring check before any regex work
+    if "#" not in text and "issue" not in text.lower():
+        return None
+    match = _ISSUE_HASH_RE.search(text)
     if match:
         return match.group(1)
-    match = re.search(r"issue[-/](\d+)", text, re.IGNORECASE)
+    match = _ISSUE_KW_RE.search(text)
     if match:
         return match.group(1)
     return None
 
 
+# Slotted row types for the normalized data: one fixed-size object per
+# row instead of a dict, so the correlate loops do C-level slot reads
+# rather than hashing a key per field.
+
+
+@dataclass(slots=True)
+class NormSession:
+    id: str
+    full_name: str
+    state: str
+    created_at: str
+    title: str
+    pr_url: str
+    branch: str
+
+
+@dataclass(slots=True)
+class NormIssue:
+    id: str
+    title: str
+    assignees: str
+    updated_at: str
+    url: str
+
+
+@dataclass(slots=True)
+class NormPR:
+    id: str
+    title: str
+    branch: str
+    review: str
+    updated_at: str
+    url: str
+
+
+def _sid(name):
+    """Session ID: the last path segment of the resource name.
+
+    rpartition returns a tuple instead of building a list the way
+    split does, and names without a slash come back unchanged.
+    """
+    if not name:
+        return "N/A"
+    return name.rpartition("/")[2]
+
+
 def normalize_sessions(sessions):
     data = []
     for s in sessions:
@@ -128,11 +228,7 @@ def normalize_sessions(sessions):
                 pr_url = o["pullRequest"].get("url")
                 break
 
-        sid = (
-            s.get("name", "").split("/")[-1]
-            if "/" in s.get("name", "")
-            else s.get("name", "N/A")
-        )
+        sid = _sid(s.get("name"))
 
         # Extract branch directly from session sourceContext
         session_branch = (
@@ -142,15 +238,15 @@ def normalize_sessions(sessions):
         )
 
         data.append(
-            {
-                "id": sid,
-                "full_name": s.get("name"),
-                "state": s.get("state"),
-                "created_at": s.get("createTime"),
-                "title": s.get("title", "").split("\n")[0],
-                "pr_url": pr_url,
-                "branch": session_branch,  # Add the branch here
-            }
+            NormSession(
+                id=sid,
+                full_name=s.get("name"),
+                state=s.get("state"),
+                created_at=s.get("createTime"),
+                title=s.get("title", "").split("\n")[0],
+                pr_url=pr_url,
+                branch=session_branch,  # Add the branch here
+            )
         )
     return data
 
@@ -160,13 +256,13 @@ def normalize_issues(issues):
     for i in issues:
         assignees = [a["login"] for a in i.get("assignees", [])]
         data.append(
-            {
-                "id": str(i.get("number")),
-                "title": i.get("title"),
-                "assignees": ", ".join(assignees),
-                "updated_at": i.get("updatedAt"),
-                "url": i.get("url"),
-            }
+            NormIssue(
+                id=str(i.get("number")),
+                title=i.get("title"),
+                assignees=", ".join(assignees),
+                updated_at=i.get("updatedAt"),
+                url=i.get("url"),
+            )
         )
     return data
 
@@ -175,99 +271,221 @@ def normalize_prs(prs):
     data = []
     for p in prs:
         data.append(
-            {
-                "id": str(p.get("number")),
-                "title": p.get("title"),
-                "branch": p.get("headRefName"),
-                "review": p.get("reviewDecision"),
-                "updated_at": p.get("updatedAt"),
-                "url": p.get("url"),
-            }
+            NormPR(
+                id=str(p.get("number")),
+                title=p.get("title"),
+                branch=p.get("headRefName"),
+                review=p.get("reviewDecision"),
+                updated_at=p.get("updatedAt"),
+                url=p.get("url"),
+            )
         )
     return data
 
 
-def correlate_data(sessions, issues, prs):
-    """Groups data into Workstreams."""
+def _extract_issue_series(series):
+    """Vectorized extract_issue_id over a string Series."""
+    series = series.fillna("").astype(str)
+    by_hash = series.str.extract(_ISSUE_HASH_RE, expand=False)
+    by_keyword = series.str.extract(_ISSUE_KW_RE, expand=False)
+    return by_hash.fillna(by_keyword)
+
+
+def _correlate_with_pandas(normalized_sessions, normalized_issues,
+                           normalized_prs):
+    """Vectorized correlate_data: merges + str.extract instead of
+    per-row Python loops. Returns the same workstream dicts."""
+    _load_pandas()
+    df_sess = pd.DataFrame(
+        normalized_sessions,
+        columns=["id", "full_name", "state", "created_at", "title",
+                 "pr_url", "branch"],
+    )
+    df_prs = pd.DataFrame(
+        normalized_prs,
+        columns=["id", "title", "branch", "review", "updated_at", "url"],
+    ).add_prefix("p_")
+    issue_titles = {i.id: i.title for i in normalized_issues}
+
+    # 1. Sessions, left-joined to their PR by URL. Null PR URLs are
+    # dropped from the right side first so a url-less PR never joins
+    # against a session that has no PR (mirrors the None-key filter on
+    # pr_map_by_url in the pure-Python path).
+    merged = df_sess.merge(
+        df_prs[df_prs["p_url"].notna()],
+        how="left", left_on="pr_url", right_on="p_url",
+    )
+    linked = merged["p_id"].notna()
+
+    branch = merged["p_branch"].where(linked, merged["branch"])
+    last_activity = merged["p_updated_at"].where(linked, merged["created_at"])
+    pr_id = ("#" + merged["p_id"]).where(linked)
+    pr_status = merged["p_review"].where(linked)
+
+    # Issue via PR branch/title when linked, else via session title
+    iid = (
+        _extract_issue_series(merged["p_branch"])
+        .fillna(_extract_issue_series(merged["p_title"]))
+        .where(linked)
+        .fillna(_extract_issue_series(merged["title"]))
+    )
+
+    session_rows = pd.DataFrame(
+        {
+            "session_id": merged["id"],
+            "session_state": merged["state"],
+            "session_title": merged["title"],
+            "session_created": merged["created_at"],
+            "last_activity": last_activity,
+            "pr_id": pr_id,
+            "pr_status": pr_status,
+            "branch": branch,
+            "issue_id": ("#" + iid).where(iid.notna()),
+            "issue_title": iid.map(issue_titles),
+        }
+    )
+
+    # 2. Orphan PRs (no session points at them)
+    linked_urls = set(df_sess["pr_url"].dropna())
+    orphans = df_prs[~df_prs["p_url"].isin(linked_urls)]
+    orphan_iid = _extract_issue_series(orphans["p_branch"]).fillna(
+        _extract_issue_series(orphans["p_title"])
+    )
+    orphan_rows = pd.DataFrame(
+        {
+            "session_id": "-",
+            "session_state": "-",
+            "session_title": "-",
+            "session_created": "-",
+            "last_activity": orphans["p_updated_at"],
+            "pr_id": "#" + orphans["p_id"],
+            "pr_status": orphans["p_review"],
+            "branch": orphans["p_branch"],
+            "issue_id": ("#" + orphan_iid).where(orphan_iid.notna()),
+            "issue_title": orphan_iid.map(issue_titles),
+        }
+    )
+
+    combined = pd.concat([session_rows, orphan_rows], ignore_index=True)
+    combined = combined.astype(object).where(combined.notna(), None)
+    workstreams = combined.to_dict("records")
+    workstreams.sort(key=lambda x: x.get("last_activity") or "", reverse=True)
+    return workstreams
+
+
+def _build_normalized(sessions, issues, prs):
+    """Normalize the three raw lists once and correlate them.
+
+    Returns (normalized_sessions, normalized_issues, normalized_prs,
+    workstreams) so dashboard and export views can share one pass
+    instead of re-normalizing per view.
+    """
     normalized_sessions = normalize_sessions(sessions)
     normalized_issues = normalize_issues(issues)
     normalized_prs = normalize_prs(prs)
+    workstreams = _correlate_normalized(
+        normalized_sessions, normalized_issues, normalized_prs
+    )
+    return normalized_sessions, normalized_issues, normalized_prs, workstreams
+
+
+def correlate_data(sessions, issues, prs):
+    """Groups data into Workstreams."""
+    return _build_normalized(sessions, issues, prs)[3]
+
+
+def _ws_sort_key(row, _get=operator.itemgetter("last_activity")):
+    return _get(row) or ""
 
-    issue_map = {i["id"]: i for i in normalized_issues}
-    pr_map_by_url = {p["url"]: p for p in normalized_prs}
+
+def _correlate_normalized(normalized_sessions, normalized_issues,
+                          normalized_prs):
+    """Correlate already-normalized sessions/issues/PRs."""
+    if HAS_PANDAS:
+        return _correlate_with_pandas(
+            normalized_sessions, normalized_issues, normalized_prs
+        )
+
+    issue_map = {i.id: i for i in normalized_issues}
+    # Skip None keys so the hot lookup below never hashes None.
+    pr_map_by_url = {p.url: p for p in normalized_prs if p.url}
 
     workstreams = []
+    linked_pr_urls = set()
 
     # 1. Start with Sessions
     for s in normalized_sessions:
         row = {
-            "session_id": s["id"],
-            "session_state": s["state"],
-            "session_title": s["title"],
-            "session_created": s["created_at"],
-            "last_activity": s["created_at"],  # default
+            "session_id": s.id,
+            "session_state": s.state,
+            "session_title": s.title,
+            "session_created": s.created_at,
+            "last_activity": s.created_at,  # default
             "pr_id": None,
             "pr_status": None,
-            "branch": s["branch"],  # Initialize branch from session data
+            "branch": s.branch,  # Initialize branch from session data
             "issue_id": None,
             "issue_title": None,
         }
 
         # Link PR
-        if s["pr_url"] and s["pr_url"] in pr_map_by_url:
-            pr = pr_map_by_url[s["pr_url"]]
-            row["pr_id"] = f"#{pr['id']}"
-            row["pr_status"] = pr["review"]
-            row["branch"] = pr["branch"]
-            row["last_activity"] = pr[
-                "updated_at"
-            ]  # PR update is newer than session create
+        pr_url = s.pr_url
+        pr = pr_map_by_url.get(pr_url) if pr_url else None
+        if pr_url:
+            linked_pr_urls.add(pr_url)
+        if pr:
+            row["pr_id"] = f"#{pr.id}"
+            row["pr_status"] = pr.review
+            row["branch"] = pr.branch
+            row["last_activity"] = (
+                pr.updated_at
+            )  # PR update is newer than session create
 
             # Link Issue via PR
-            found_issue = extract_issue_id(pr["branch"]) or extract_issue_id(
-                pr["title"]
+            found_issue = extract_issue_id(pr.branch) or extract_issue_id(
+                pr.title
             )
             if found_issue:
                 row["issue_id"] = f"#{found_issue}"
-                if found_issue in issue_map:
-                    row["issue_title"] = issue_map[found_issue]["title"]
+                issue = issue_map.get(found_issue)
+                if issue:
+                    row["issue_title"] = issue.title
 
         # Link Issue via Session Title
         if not row["issue_id"]:
-            found_issue = extract_issue_id(s["title"])
+            found_issue = extract_issue_id(s.title)
             if found_issue:
                 row["issue_id"] = f"#{found_issue}"
-                if found_issue in issue_map:
-                    row["issue_title"] = issue_map[found_issue]["title"]
+                issue = issue_map.get(found_issue)
+                if issue:
+                    row["issue_title"] = issue.title
 
         workstreams.append(row)
 
-    # 2. Catch Orphan PRs
-    linked_pr_urls = {s["pr_url"] for s in normalized_sessions if s["pr_url"]}
+    # 2. Catch Orphan PRs (linked_pr_urls was filled during the session
+    # pass above, saving a second sweep over the sessions)
     for p in normalized_prs:
-        if p["url"] not in linked_pr_urls:
-            iid = extract_issue_id(p["branch"]) or extract_issue_id(p["title"])
+        if p.url not in linked_pr_urls:
+            iid = extract_issue_id(p.branch) or extract_issue_id(p.title)
+            issue = issue_map.get(iid) if iid else None
             workstreams.append(
                 {
                     "session_id": "-",
                     "session_state": "-",
                     "session_title": "-",
                     "session_created": "-",
-                    "last_activity": p["updated_at"],
-                    "pr_id": f"#{p['id']}",
-                    "pr_status": p["review"],
-                    "branch": p["branch"],
+                    "last_activity": p.updated_at,
+                    "pr_id": f"#{p.id}",
+                    "pr_status": p.review,
+                    "branch": p.branch,
                     "issue_id": f"#{iid}" if iid else None,
-                    "issue_title": (
-                        issue_map[iid]["title"]
-                        if (iid and iid in issue_map)
-                        else None
-                    ),
+                    "issue_title": issue.title if issue else None,
                 }
             )
 
-    # Sort by last_activity
-    workstreams.sort(key=lambda x: x.get("last_activity") or "", reverse=True)
+    # Sort by last_activity (every row carries the key, so direct
+    # indexing beats .get; None still sorts as "")
+    workstreams.sort(key=_ws_sort_key, reverse=True)
     return workstreams
 
 
@@ -276,9 +494,45 @@ def correlate_data(sessions, issues, prs):
 # -------------------------------------------------------------------------
 
 
+def _format_time_series(series, now):
+    """Vectorized format_time for a column of ISO timestamps.
+
+    Same output as format_time row by row, but the parse and the
+    bucket math run in NumPy instead of a Python call per row.
+    Unparseable values fall back to the original string.
+    """
+    ts = pd.to_datetime(series, utc=True, errors="coerce")
+    valid = ts.notna()
+    epoch = (ts - pd.Timestamp(0, tz="utc")) / pd.Timedelta(seconds=1)
+    delta = now - epoch
+
+    days_f = np.floor_divide(delta, 86400)
+    secs = delta - days_f * 86400
+    days = np.nan_to_num(days_f).astype("int64")
+    hours = np.nan_to_num(np.floor_divide(secs, 3600)).astype("int64")
+    minutes = np.nan_to_num(
+        np.floor_divide(np.mod(secs, 3600), 60)
+    ).astype("int64")
+
+    out = np.select(
+        [days > 365, days > 0, hours > 0],
+        [
+            np.char.add((days // 365).astype(str), "y ago"),
+            np.char.add(days.astype(str), "d ago"),
+            np.char.add(hours.astype(str), "h ago"),
+        ],
+        default=np.char.add(minutes.astype(str), "m ago"),
+    )
+    return pd.Series(out, index=series.index, dtype=object).where(
+        valid, series.fillna("")
+    )
+
+
 def print_pandas_dashboard(sessions, issues, prs):
-    workstreams = correlate_data(sessions, issues, prs)
+    _load_pandas()
+    _, norm_issues, _, workstreams = _build_normalized(sessions, issues, prs)
     df_ws = pd.DataFrame(workstreams)
+    now = time.time()
 
     print("\n" + "=" * 100)
     print(" 🔗 ACTIVE WORKSTREAMS (Grouped)")
@@ -295,26 +549,32 @@ def print_pandas_dashboard(sessions, issues, prs):
                 "last_activity",
             ]
         ].copy()
-        view["last_activity"] = view["last_activity"].apply(format_time)
-
-        # Rename for display
-        view.rename(
-            columns={
-                "issue_id": "Issue",
-                "issue_title": "Task",
-                "session_id": "Jules ID",
-                "session_state": "State",
-                "pr_id": "PR",
-                "pr_status": "Review",
-                "last_activity": "Updated",
-            },
-            inplace=True,
+        view["last_activity"] = _format_time_series(
+            view["last_activity"], now
         )
 
-        view["Task"] = view["Task"].apply(
-            lambda x: (str(x)[:30] + "..") if x and len(str(x)) > 30 else x
+        # Stream rows with a precomputed template instead of
+        # df.to_string(), which builds the whole table in memory via
+        # per-cell repr (same pattern as print_dashboard).
+        fmt = "{:<8} {:<34} {:<22} {:<12} {:<7} {:<18} {:<8}\n"
+        out = sys.stdout
+        out.write(
+            fmt.format(
+                "Issue", "Task", "Jules ID", "State", "PR", "Review",
+                "Updated",
+            )
         )
-        print(view.to_string(index=False))
+        for (issue, task, sess, state, pr, review,
+             updated) in view.itertuples(index=False, name=None):
+            task = str(task) if task else "-"
+            if len(task) > 30:
+                task = task[:30] + ".."
+            out.write(
+                fmt.format(
+                    issue or "-", task, sess or "-", state or "-",
+                    pr or "-", review or "-", updated or "-",
+                )
+            )
     else:
         print("No active workstreams found.")
 
@@ -327,14 +587,20 @@ def print_pandas_dashboard(sessions, issues, prs):
         if w["issue_id"]:
             assigned_ids.add(w["issue_id"].replace("#", ""))
 
-    norm_issues = normalize_issues(issues)
-    backlog = [i for i in norm_issues if i["id"] not in assigned_ids]
+    backlog = [i for i in norm_issues if i.id not in assigned_ids]
 
     df_bl = pd.DataFrame(backlog)
     if not df_bl.empty:
-        view_bl = df_bl[["id", "title", "updated_at"]].copy()
-        view_bl["updated_at"] = view_bl["updated_at"].apply(format_time)
-        print(view_bl.to_string(index=False))
+        bl_times = _format_time_series(df_bl["updated_at"], now)
+        fmt = "{:<6} {:<60} {:<8}\n"
+        out = sys.stdout
+        out.write(fmt.format("ID", "Title", "Updated"))
+        for iid, title, updated in zip(
+            df_bl["id"], df_bl["title"], bl_times
+        ):
+            out.write(
+                fmt.format(iid or "-", str(title)[:60], updated or "-")
+            )
     else:
         print("No orphaned issues.")
 
@@ -349,13 +615,16 @@ def print_dashboard(sessions, issues, prs):
     )
     print("-" * 100)
 
+    now = time.time()
     for w in workstreams[:25]:
-        updated = format_time(w["last_activity"])[:9]
+        updated = format_time(w["last_activity"], now)[:9]
         issue = w["issue_id"] or "-"
         sess = w["session_id"][:16] or "-"
 
         # Use Icon for state
-        state_icon = get_state_icon(w["session_state"], w["session_created"])
+        state_icon = get_state_icon(
+            w["session_state"], w["session_created"], now
+        )
 
         pr = w["pr_id"] or "-"
 
@@ -383,20 +652,28 @@ def print_dashboard(sessions, issues, prs):
     print("-" * 80)
     for i in issues[:10]:
         print(
-            f"#{i['number']:<5} {format_time(i['updatedAt']):<10} "
+            f"#{i['number']:<5} {format_time(i['updatedAt'], now):<10} "
             f"{i['title'][:60]}"
         )
 
 
 def export_data(sessions, issues, prs, fmt="csv"):
-    """Exports data to files, using Pandas if available."""
-    workstreams = correlate_data(sessions, issues, prs)
+    """Exports data to files, streaming rows through the stdlib writers.
+
+    The rows are flat strings either way, so building a DataFrame just
+    to serialize it only added a second in-memory copy of every table;
+    csv.writer/json.dump stream straight from the existing rows and
+    behave identically with or without pandas installed.
+    """
+    norm_sess, norm_issues, norm_prs, workstreams = _build_normalized(
+        sessions, issues, prs
+    )
     data_dir = get_data_dir()
 
     datasets = {
-        "jules_sessions": normalize_sessions(sessions),
-        "github_issues": normalize_issues(issues),
-        "github_prs": normalize_prs(prs),
+        "jules_sessions": norm_sess,
+        "github_issues": norm_issues,
+        "github_prs": norm_prs,
         "consolidated_workstreams": workstreams,
     }
 
@@ -408,25 +685,32 @@ def export_data(sessions, issues, prs, fmt="csv"):
             continue
 
         try:
-            if HAS_PANDAS:
-                # Use Pandas for robust export
-                df = pd.DataFrame(data)
-                if fmt == "csv":
-                    df.to_csv(filename, index=False)
-                elif fmt == "json":
-                    df.to_json(filename, orient="records", indent=2)
+            # Normalized rows are slotted dataclasses; workstreams
+            # stay plain dicts. Either way the getter extracts row
+            # tuples in C, skipping per-field key lookups.
+            if isinstance(data[0], dict):
+                fieldnames = list(data[0].keys())
+                getter = operator.itemgetter(*fieldnames)
             else:
-                # Fallback to standard library
-                if fmt == "csv":
-                    with open(
-                        filename, "w", newline="", encoding="utf-8"
-                    ) as f:
-                        writer = csv.DictWriter(f, fieldnames=data[0].keys())
-                        writer.writeheader()
-                        writer.writerows(data)
-                elif fmt == "json":
+                fieldnames = [f.name for f in fields(data[0])]
+                getter = operator.attrgetter(*fieldnames)
+
+            if fmt == "csv":
+                with open(filename, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(fieldnames)
+                    writer.writerows(getter(row) for row in data)
+            elif fmt == "json":
+                if _HAS_ORJSON:
+                    with open(filename, "wb") as f:
+                        f.write(
+                            orjson.dumps(data, option=orjson.OPT_INDENT_2)
+                        )
+                else:
                     with open(filename, "w", encoding="utf-8") as f:
-                        json.dump(data, f, indent=2)
+                        # default=asdict converts dataclass rows lazily
+                        # as iterencode reaches them.
+                        json.dump(data, f, indent=2, default=asdict)
 
             logger.info(f"  ✅ Saved {filename}")
         except Exception as e:
@@ -434,38 +718,56 @@ def export_data(sessions, issues, prs, fmt="csv"):
 
 
 def generate_markdown_summary(sessions):
+    """Write the session summary table from any session iterable.
+
+    Only the handful of fields the table needs are collected per
+    session, so streaming iterators (iter_sessions) never hold full
+    session payloads just for the sort.
+    """
     filename = "jules_sessions_summary.md"
-    sessions.sort(key=lambda s: s.get("createTime", ""), reverse=True)
+
+    rows = []
+    for session in sessions:
+        pr_url = next(
+            (
+                output["pullRequest"].get("url", "")
+                for output in session.get("outputs", [])
+                if "pullRequest" in output
+            ),
+            None,
+        )
+        pr_link = f"[PR]({pr_url})" if pr_url is not None else ""
+
+        rows.append(
+            (
+                session.get("createTime", ""),
+                _sid(session.get("name")),
+                session.get("state", "N/A"),
+                session.get("title", "N/A"),
+                pr_link,
+            )
+        )
+
+    rows.sort(reverse=True)
 
     header = "| Session Name | State | Age | Title | PR Link |\n"
     separator = "|---|---|---|---|---|\n"
 
     try:
+        # Assemble the document in memory and flush it with a single
+        # write: one syscall instead of one per table row.
+        now = time.time()
+        buf = io.StringIO()
+        buf.write(f"# Jules Session Summary\nGenerated: {datetime.now()}\n\n")
+        buf.write(header)
+        buf.write(separator)
+
+        for created, name, state, title, pr_link in rows:
+            age = format_time(created, now)
+            buf.write(f"| {name} | {state} | {age} | {title} | {pr_link} |\n")
+
         with open(filename, "w") as f:
-            f.write(
-                f"# Jules Session Summary\nGenerated: {datetime.now()}\n\n"
-            )
-            f.write(header)
-            f.write(separator)
-
-            for session in sessions:
-                name = session.get("name", "N/A").split("/")[-1]
-                state = session.get("state", "N/A")
-                created = session.get("createTime", "")
-                age = format_time(created)
-                title = session.get("title", "N/A")
-
-                pr_link = ""
-                outputs = session.get("outputs", [])
-                for output in outputs:
-                    if "pullRequest" in output:
-                        pr_url = output["pullRequest"].get("url", "")
-                        pr_link = f"[PR]({pr_url})"
-                        break
-
-                f.write(
-                    f"| {name} | {state} | {age} | {title} | {pr_link} |\n"
-                )
+            f.write(buf.getvalue())
         logger.info(f"📄 Summary generated: {filename}")
     except Exception as e:
         logger.error(f"Failed to generate summary: {e}")
@@ -476,6 +778,236 @@ def generate_markdown_summary(sessions):
 # -------------------------------------------------------------------------
 
 
+def _fetch_workspace_data(client):
+    """Fetch sessions, open issues and open PRs concurrently.
+
+    GitHub issues and PRs come back in one combined GraphQL query,
+    overlapped with the Jules session fetch; wall time is roughly the
+    slower of the two calls.
+    """
+    logger.info("🔄 Refreshing data from Jules and GitHub...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sessions_future = executor.submit(client.list_sessions)
+        items_future = executor.submit(gh_client.list_open_items, limit=100)
+
+        sessions = sessions_future.result()
+        issues, prs = items_future.result()
+
+    return sessions, issues, prs
+
+
+def _cmd_status(client, args):
+    sessions, issues, prs = _fetch_workspace_data(client)
+    if args.style == "pandas":
+        if HAS_PANDAS:
+            print_pandas_dashboard(sessions, issues, prs)
+            return
+        logger.warning(
+            "Pandas is not installed. Falling back to table view."
+        )
+    print_dashboard(sessions, issues, prs)
+
+
+def _cmd_export(client, args):
+    sessions, issues, prs = _fetch_workspace_data(client)
+    export_data(sessions, issues, prs, fmt=args.format)
+
+
+def _cmd_create(client, args):
+    session_name = client.create_session(
+        args.prompt, args.source, args.branch, args.title
+    )
+    if session_name:
+        print(f"✅ Session started: {session_name}")
+        if not args.no_watch:
+            client.monitor_session(session_name)
+
+
+def _cmd_work_on(client, args):
+    data = fetch_issue_context(args.issue_id)
+    if not data:
+        logger.error("Could not fetch issue data.")
+        sys.exit(1)
+
+    branch_name = args.branch or f"feature/issue-{args.issue_id}"
+    logger.info(
+        f"Assigning Jules  Issue #{args.issue_id} -> Branch: {branch_name}"
+    )
+    session_name = client.create_session(
+        prompt=data["prompt"],
+        source=DEFAULT_SOURCE,
+        branch=branch_name,
+        title=f"Fix: {data['title']} (#{args.issue_id})",
+    )
+
+    if session_name:
+        print(f"✅ Session started: {session_name}")
+        client.monitor_session(session_name)
+
+
+def _cmd_watch(client, args):
+    client.monitor_session(
+        args.session_name,
+        initial_interval=args.initial_interval,
+        max_interval=args.max_interval,
+    )
+
+
+def _cmd_message(client, args):
+    if client.send_message(args.session_name, args.text):
+        logger.info("📨 Message sent.")
+        client.monitor_session(args.session_name)
+
+
+def _cmd_publish(client, args):
+    if client.send_message(
+        args.session_name,
+        "Please publish the branch and create the Pull Request now.",
+    ):
+        logger.info("📨 Publish request sent to Jules.")
+        logger.info("   Monitoring for PR link...")
+        client.monitor_session(args.session_name)
+
+
+def _cmd_delete(client, args):
+    client.delete_session(args.session_name)
+
+
+def _cmd_delete_old(client, args):
+    hours_old = args.hours_old
+    logger.info(f"🗑️ Deleting sessions older than {hours_old} hours...")
+
+    # Filter first with one cutoff computed up front, then fan the
+    # deletions out — they're independent API calls, and the client's
+    # retry policy absorbs any 429s.
+    now = time.time()
+    cutoff = now - hours_old * 3600
+    stale = []
+    for s in client.iter_sessions():
+        created_at_iso = s.get("createTime")
+        if not created_at_iso:
+            continue
+        try:
+            if _iso_to_epoch(created_at_iso) < cutoff:
+                session_id = _sid(s.get("name"))
+                logger.info(
+                    f"    Deleting session: {session_id} "
+                    f"(Created: {format_time(created_at_iso, now)})"
+                )
+                stale.append(session_id)
+        except ValueError as e:
+            logger.warning(f"Could not parse createTime '{created_at_iso}' for session {s.get('name', 'N/A')}: {e}")
+
+    deleted_count = 0
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for success in executor.map(client.delete_session, stale):
+            if success:
+                deleted_count += 1
+    logger.info(f"✅ Deleted {deleted_count} sessions older than {hours_old} hours.")
+
+
+def _cmd_health_check(client, args):
+    logger.info("🏥 Running Session Health Check...")
+    # Same overlap as _fetch_workspace_data: both calls are I/O-bound
+    # and independent.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sessions_future = executor.submit(client.list_sessions)
+        prs_future = executor.submit(
+            gh_client.list_prs, state="all", limit=100
+        )  # Need closed/merged too
+
+        sessions = sessions_future.result()
+        prs = prs_future.result()
+
+    pr_map = {p['url']: p for p in prs}
+
+    stalled_sessions = []
+    orphaned_sessions = []
+
+    now_utc = datetime.now(timezone.utc)
+
+    for s in sessions:
+        sid = _sid(s.get("name"))
+        state = s.get("state")
+        created_at_iso = s.get("createTime")
+
+        # Check stalled: Running for > 24h
+        if state == "RUNNING" and created_at_iso:
+            try:
+                dt_utc = datetime.fromisoformat(created_at_iso.replace("Z", "+00:00"))
+                if (now_utc - dt_utc).total_seconds() > 24 * 3600:
+                    stalled_sessions.append(s)
+            except ValueError:
+                pass
+
+        # Check orphaned: Associated PR is closed/merged but session is active
+        outputs = s.get("outputs", [])
+        for o in outputs:
+            if "pullRequest" in o:
+                pr_url = o["pullRequest"].get("url")
+                if pr_url in pr_map:
+                    pr = pr_map[pr_url]
+                    if pr['state'] in ['MERGED', 'CLOSED'] and state not in ['SUCCEEDED', 'FAILED', 'CANCELLED', 'TERMINATED']:
+                        orphaned_sessions.append((s, pr['state']))
+
+    if not stalled_sessions and not orphaned_sessions:
+        print("✅ All sessions look healthy.")
+    else:
+        if stalled_sessions:
+            print(f"\n🐢 Found {len(stalled_sessions)} Stalled Sessions (>24h running):")
+            for s in stalled_sessions:
+                print(f"  - {s.get('name')} ({s.get('title')})")
+
+        if orphaned_sessions:
+            print(f"\n👻 Found {len(orphaned_sessions)} Orphaned Sessions (PR closed/merged):")
+            for s, status in orphaned_sessions:
+                print(f"  - {s.get('name')} (PR Status: {status})")
+
+        if args.clean:
+            print("\n🧹 Cleaning up unhealthy sessions...")
+            for s in stalled_sessions:
+                sid = _sid(s.get("name"))
+                logger.info(f"Deleting stalled session {sid}...")
+                client.delete_session(sid)
+
+            for s, _ in orphaned_sessions:
+                sid = _sid(s.get("name"))
+                logger.info(f"Deleting orphaned session {sid}...")
+                client.delete_session(sid)
+            print("✅ Cleanup complete.")
+        else:
+            print("\nUse --clean to delete these sessions.")
+
+
+def _cmd_list_sources(client, args):
+    sources = client.list_sources()
+    print(f"\nFound {len(sources)} sources:")
+    for s in sources:
+        print(f"- {s.get('name')} (ID: {s.get('id')})")
+
+
+def _cmd_summary(client, args):
+    generate_markdown_summary(client.iter_sessions())
+
+
+# Command name -> handler. O(1) dispatch instead of an if/elif ladder,
+# and each handler stays independently testable.
+COMMANDS = {
+    "status": _cmd_status,
+    "export": _cmd_export,
+    "create": _cmd_create,
+    "work-on": _cmd_work_on,
+    "watch": _cmd_watch,
+    "message": _cmd_message,
+    "publish": _cmd_publish,
+    "delete": _cmd_delete,
+    "delete-old": _cmd_delete_old,
+    "health-check": _cmd_health_check,
+    "list-sources": _cmd_list_sources,
+    "summary": _cmd_summary,
+}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Jules Ops & GitHub Sync Tool"
@@ -483,6 +1015,17 @@ def main():
     parser.add_argument(
         "--api-key", help="Jules API Key (or set JULES_API_KEY env)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the short-lived on-disk response cache",
+    )
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        default=60,
+        help="Maximum age in seconds for cached responses (default: 60)",
+    )
 
     subparsers = parser.add_subparsers(
         dest="command", help="Available commands"
@@ -531,6 +1074,18 @@ def main():
     # Session Management
     p_watch = subparsers.add_parser("watch", help="Monitor a session")
     p_watch.add_argument("session_name", help="Session ID/Name")
+    p_watch.add_argument(
+        "--initial-interval",
+        type=float,
+        default=2.0,
+        help="Starting poll interval in seconds",
+    )
+    p_watch.add_argument(
+        "--max-interval",
+        type=float,
+        default=30.0,
+        help="Poll interval cap in seconds",
+    )
 
     p_msg = subparsers.add_parser("message", help="Send message to session")
     p_msg.add_argument("session_name", help="Session ID/Name")
@@ -569,183 +1124,17 @@ def main():
         parser.print_help()
         return
 
-    # Initialize Client
-    client = get_jules_client(api_key=args.api_key)
-
-    # Common Fetch Logic for Status and Export
-    if args.command in ["status", "export"]:
-        logger.info("🔄 Refreshing data from Jules and GitHub...")
-        sessions = client.list_sessions()
-
-        issues = gh_client.list_issues(state="open", limit=100)
-        prs = gh_client.list_prs(state="open", limit=100)
-
-        if args.command == "status":
-            if args.style == "pandas":
-                if HAS_PANDAS:
-                    print_pandas_dashboard(sessions, issues, prs)
-                else:
-                    logger.warning(
-                        "Pandas is not installed. Falling back to table view."
-                    )
-                    print_dashboard(sessions, issues, prs)
-            else:
-                print_dashboard(sessions, issues, prs)
-
-        elif args.command == "export":
-            export_data(sessions, issues, prs, fmt=args.format)
-
-    elif args.command == "create":
-        session_name = client.create_session(
-            args.prompt, args.source, args.branch, args.title
-        )
-        if session_name:
-            print(f"✅ Session started: {session_name}")
-            if not args.no_watch:
-                client.monitor_session(session_name)
-
-    elif args.command == "work-on":
-        data = fetch_issue_context(args.issue_id)
-        if not data:
-            logger.error("Could not fetch issue data.")
-            sys.exit(1)
-
-        branch_name = args.branch or f"feature/issue-{args.issue_id}"
-        logger.info(
-            f"Assigning Jules  Issue #{args.issue_id} -> Branch: {branch_name}"
-        )
-        session_name = client.create_session(
-            prompt=data["prompt"],
-            source=DEFAULT_SOURCE,
-            branch=branch_name,
-            title=f"Fix: {data['title']} (#{args.issue_id})",
-        )
-
-        if session_name:
-            print(f"✅ Session started: {session_name}")
-            client.monitor_session(session_name)
-
-    elif args.command == "watch":
-        client.monitor_session(args.session_name)
-
-    elif args.command == "message":
-        if client.send_message(args.session_name, args.text):
-            logger.info("📨 Message sent.")
-            client.monitor_session(args.session_name)
-
-    elif args.command == "publish":
-        if client.send_message(
-            args.session_name,
-            "Please publish the branch and create the Pull Request now.",
-        ):
-            logger.info("📨 Publish request sent to Jules.")
-            logger.info("   Monitoring for PR link...")
-            client.monitor_session(args.session_name)
-
-    elif args.command == "delete":
-        client.delete_session(args.session_name)
-
-    elif args.command == "delete-old":
-        # New command to delete old sessions
-        hours_old = args.hours_old
-        logger.info(f"🗑️ Deleting sessions older than {hours_old} hours...")
-        sessions = client.list_sessions()
-        deleted_count = 0
-        for s in sessions:
-            created_at_iso = s.get("createTime")
-            if created_at_iso:
-                try:
-                    dt_utc = datetime.fromisoformat(created_at_iso.replace("Z", "+00:00"))
-                    now_utc = datetime.now(timezone.utc)
-                    delta = now_utc - dt_utc
-
-                    if delta.total_seconds() > hours_old * 3600:
-                        session_id = (
-                            s.get("name", "").split("/")[-1]
-                            if "/" in s.get("name", "")
-                            else s.get("name", "N/A")
-                        )
-                        logger.info(f"    Deleting session: {session_id} (Created: {format_time(created_at_iso)})")
-                        client.delete_session(session_id)
-                        deleted_count += 1
-                        time.sleep(1)  # Add a delay to avoid rate-limiting
-                except ValueError as e:
-                    logger.warning(f"Could not parse createTime '{created_at_iso}' for session {s.get('name', 'N/A')}: {e}")
-        logger.info(f"✅ Deleted {deleted_count} sessions older than {hours_old} hours.")
-
-    elif args.command == "health-check":
-        logger.info("🏥 Running Session Health Check...")
-        sessions = client.list_sessions()
-        prs = gh_client.list_prs(state="all", limit=100) # Need closed/merged too
-
-        pr_map = {p['url']: p for p in prs}
-
-        stalled_sessions = []
-        orphaned_sessions = []
-
-        now_utc = datetime.now(timezone.utc)
-
-        for s in sessions:
-            sid = s.get("name", "").split("/")[-1]
-            state = s.get("state")
-            created_at_iso = s.get("createTime")
-
-            # Check stalled: Running for > 24h
-            if state == "RUNNING" and created_at_iso:
-                try:
-                    dt_utc = datetime.fromisoformat(created_at_iso.replace("Z", "+00:00"))
-                    if (now_utc - dt_utc).total_seconds() > 24 * 3600:
-                        stalled_sessions.append(s)
-                except ValueError:
-                    pass
-
-            # Check orphaned: Associated PR is closed/merged but session is active
-            outputs = s.get("outputs", [])
-            for o in outputs:
-                if "pullRequest" in o:
-                    pr_url = o["pullRequest"].get("url")
-                    if pr_url in pr_map:
-                        pr = pr_map[pr_url]
-                        if pr['state'] in ['MERGED', 'CLOSED'] and state not in ['SUCCEEDED', 'FAILED', 'CANCELLED', 'TERMINATED']:
-                            orphaned_sessions.append((s, pr['state']))
-
-        if not stalled_sessions and not orphaned_sessions:
-            print("✅ All sessions look healthy.")
-        else:
-            if stalled_sessions:
-                print(f"\n🐢 Found {len(stalled_sessions)} Stalled Sessions (>24h running):")
-                for s in stalled_sessions:
-                    print(f"  - {s.get('name')} ({s.get('title')})")
-
-            if orphaned_sessions:
-                print(f"\n👻 Found {len(orphaned_sessions)} Orphaned Sessions (PR closed/merged):")
-                for s, status in orphaned_sessions:
-                    print(f"  - {s.get('name')} (PR Status: {status})")
-
-            if args.clean:
-                print("\n🧹 Cleaning up unhealthy sessions...")
-                for s in stalled_sessions:
-                    sid = s.get("name", "").split("/")[-1]
-                    logger.info(f"Deleting stalled session {sid}...")
-                    client.delete_session(sid)
-
-                for s, _ in orphaned_sessions:
-                    sid = s.get("name", "").split("/")[-1]
-                    logger.info(f"Deleting orphaned session {sid}...")
-                    client.delete_session(sid)
-                print("✅ Cleanup complete.")
-            else:
-                print("\nUse --clean to delete these sessions.")
+    ensure_workspace()
 
-    elif args.command == "list-sources":
-        sources = client.list_sources()
-        print(f"\nFound {len(sources)} sources:")
-        for s in sources:
-            print(f"- {s.get('name')} (ID: {s.get('id')})")
+    # Initialize Client. Read-only commands get a short-lived response
+    # cache so back-to-back dashboard refreshes skip the network.
+    cache_ttl = 0
+    if args.command in ["status", "export", "summary"] and not args.no_cache:
+        cache_ttl = args.max_age
+    gh_client.cache_ttl = cache_ttl
+    client = get_jules_client(api_key=args.api_key, cache_ttl=cache_ttl)
 
-    elif args.command == "summary":
-        sessions = client.list_sessions()
-        generate_markdown_summary(sessions)
+    COMMANDS[args.command](client, args)
 
 
 if __name__ == "__main__":
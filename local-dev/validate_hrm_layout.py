@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import os
 import sys
+from collections import defaultdict
 
 REQUIRED_FILES = [
     "hrm/package.json",
@@ -20,25 +21,38 @@ ARCHITECTURE_PATHS = [
     "hrm/app/client/control/page.tsx",
 ]
 
+ALL_PATHS = [*REQUIRED_FILES, *REQUIRED_DIRS, *ARCHITECTURE_PATHS]
 
-def check_path(path: str) -> bool:
-    return os.path.exists(path)
 
+def find_missing(fast_fail: bool = False) -> list:
+    """Check all required paths with one directory listing per parent.
 
-def main() -> int:
-    missing = []
+    A single listdir per parent replaces a stat call per path, which
+    matters on slow or network-mounted filesystems. With fast_fail the
+    scan stops at the first missing path.
+    """
+    by_parent = defaultdict(list)
+    for path in ALL_PATHS:
+        parent, _, name = path.rpartition("/")
+        by_parent[parent or "."].append((name, path))
 
-    for f in REQUIRED_FILES:
-        if not check_path(f):
-            missing.append(f)
+    missing = []
+    for parent, entries in by_parent.items():
+        try:
+            present = set(os.listdir(parent))
+        except OSError:
+            present = set()
+        for name, path in entries:
+            if name not in present:
+                missing.append(path)
+                if fast_fail:
+                    return missing
+    return missing
 
-    for d in REQUIRED_DIRS:
-        if not check_path(d):
-            missing.append(d)
 
-    for a in ARCHITECTURE_PATHS:
-        if not check_path(a):
-            missing.append(a)
+def main() -> int:
+    fast_fail = "--fast-fail" in sys.argv[1:]
+    missing = find_missing(fast_fail)
 
     if missing:
         print("[ERROR] HRM layout validation failed. Missing paths:")
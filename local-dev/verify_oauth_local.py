@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 import argparse
+import http.client
 import os
 import platform
 import subprocess
 import sys
 import time
+from urllib.parse import urlparse
 
 # Attempt to import secrets_ops
 try:
@@ -49,18 +51,26 @@ def get_default_chrome_profile():
 
 
 def check_server_running(base_url):
-    """Checks if the web server is running."""
+    """Checks if the web server is running.
+
+    A stdlib HEAD request instead of shelling out to curl: no process
+    spawn, and no dependency on curl being installed.
+    """
+    parsed = urlparse(base_url)
+    conn_cls = (
+        http.client.HTTPSConnection
+        if parsed.scheme == "https"
+        else http.client.HTTPConnection
+    )
+    conn = conn_cls(parsed.hostname, parsed.port, timeout=2)
     try:
-        # Use curl to quickly check headers
-        result = subprocess.run(
-            ["curl", "-I", base_url],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            timeout=2,
-        )
-        return result.returncode == 0
+        conn.request("HEAD", parsed.path or "/")
+        conn.getresponse()
+        return True
     except Exception:
         return False
+    finally:
+        conn.close()
 
 
 def main():
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+On-disk TTL cache for API responses shared by hrm-workspace clients.
+Turns repeated dashboard refreshes into cache hits instead of fresh
+network round trips.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+# Default location: ~/.cache/jules_ops/responses.db (XDG aware)
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "jules_ops"
+)
+
+
+class ResponseCache:
+    """Small SQLite-backed key/value cache with per-entry expiry."""
+
+    def __init__(self, path: Optional[Path] = None, default_ttl: float = 60.0):
+        if path is None:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            path = CACHE_DIR / "responses.db"
+
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB, etag TEXT, expires REAL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a stable cache key from arbitrary JSON-able parts."""
+        raw = json.dumps(parts, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached body for key, or None if missing/expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if not row or row[1] <= time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, body: Any, ttl: Optional[float] = None) -> None:
+        """Store body under key with the given (or default) TTL."""
+        expires = time.time() + (ttl if ttl is not None else self.default_ttl)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, etag, expires) "
+                "VALUES (?, ?, NULL, ?)",
+                (key, json.dumps(body), expires),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+
+_default_cache: Optional[ResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Process-wide shared cache instance."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
@@ -5,11 +5,16 @@ Fetches PRs, extracts changed methods/components, and asks Jules for specific re
 """
 
 import argparse
+import bisect
+import concurrent.futures
+import itertools
 import json
 import logging
 import os
 import re
+import subprocess
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -54,6 +59,8 @@ class ReviewState:
     def __init__(self, filepath: Path):
         self.filepath = filepath
         self.state: Dict[str, str] = {}  # pr_number -> commit_oid
+        # PRs are reviewed concurrently; serialize state mutation + save
+        self._lock = threading.Lock()
         self.load()
 
     def load(self):
@@ -68,16 +75,20 @@ class ReviewState:
             self.state = {}
 
     def save(self):
-        with open(self.filepath, 'w') as f:
+        # Write-then-rename so a crash mid-dump never truncates the file
+        tmp = self.filepath.with_suffix(".json.tmp")
+        with open(tmp, 'w') as f:
             json.dump(self.state, f, indent=2)
+        os.replace(tmp, self.filepath)
 
     def should_review(self, pr_number: str, commit_oid: str) -> bool:
         last_oid = self.state.get(str(pr_number))
         return last_oid != commit_oid
 
     def mark_reviewed(self, pr_number: str, commit_oid: str):
-        self.state[str(pr_number)] = commit_oid
-        self.save()
+        with self._lock:
+            self.state[str(pr_number)] = commit_oid
+            self.save()
 
 # --- Parsing Logic ---
 class BlockInfo:
@@ -102,83 +113,250 @@ class SimpleTSParser:
         r'^\s*(export\s+)?(default\s+)?(async\s+)?(function\s+\w+|const\s+\w+\s*=\s*(\(.*\)|async\s*\(.*\)|[a-zA-Z0-9_]+)\s*=>|class\s+\w+|[a-zA-Z0-9_]+\s*\(.*\)\s*\{?)'
     )
 
+    # Tokens that matter to the block scan; everything else is skipped in C
+    TOKEN_PATTERN = re.compile(r'[{}\n]')
+
     def __init__(self, content: str):
         self.lines = content.splitlines()
-        self.blocks = self._parse_blocks()
-
-    def _parse_blocks(self) -> List[BlockInfo]:
-        blocks = []
+        self.blocks = self._parse_blocks(content)
+        # Parallel array of start lines (already ascending — blocks are
+        # appended in order of appearance) for bisecting lookups.
+        self._starts = [b.start for b in self.blocks]
+
+    def _parse_blocks(self, content: str) -> List[BlockInfo]:
+        """Single token scan over the whole content.
+
+        One compiled finditer over braces and newlines replaces the three
+        full scans the old per-line loop paid (two str.count calls plus an
+        unconditional DEF_PATTERN search per line). The definition regex
+        now only runs on lines that actually open a block — a small
+        fraction of a large TSX file.
+        Brace counting is still naive about strings/comments, which is
+        sufficient for 80/20.
+        """
+        blocks: List[BlockInfo] = []
         stack: List[BlockInfo] = []
 
-        for i, line in enumerate(self.lines):
-            # Basic brace counting for the line
-            # This is naive and fails on strings/comments containing braces, but sufficient for 80/20
-            open_count = line.count('{')
-            close_count = line.count('}')
-
-            # Check if this line looks like a definition
-            is_def = bool(self.DEF_PATTERN.search(line))
-
-            # If we open more than we close, we are starting a block (or multiple)
-            net_change = open_count - close_count
+        line_no = 1
+        line_start = 0
+        net_change = 0
 
+        def flush_line(line_end: int):
+            nonlocal net_change
             if net_change > 0:
+                line = content[line_start:line_end]
+                is_def = bool(self.DEF_PATTERN.search(line))
                 for _ in range(net_change):
                     # For nested blocks on same line, only the first "counts" as the definition header usually
                     header = line.strip() if is_def else "BLOCK"
-                    blk = BlockInfo(i + 1, header) # 1-based indexing
+                    blk = BlockInfo(line_no, header)  # 1-based indexing
                     stack.append(blk)
                     if is_def: blocks.append(blk) # Only track "definitions" as meaningful blocks
-
             elif net_change < 0:
-                for _ in range(abs(net_change)):
+                for _ in range(-net_change):
                     if stack:
                         blk = stack.pop()
-                        blk.end = i + 1
-
+                        blk.end = line_no
+            net_change = 0
+
+        for match in self.TOKEN_PATTERN.finditer(content):
+            token = match.group()
+            if token == '{':
+                net_change += 1
+            elif token == '}':
+                net_change -= 1
+            else:  # newline: settle the finished line
+                flush_line(match.start())
+                line_no += 1
+                line_start = match.end()
+
+        flush_line(len(content))  # Final line without a trailing newline
         return blocks
 
     def get_enclosing_block(self, line_number: int) -> Optional[BlockInfo]:
-        """Find the smallest definition block containing the line."""
-        # blocks are stored in order of appearance (start line)
-        # We want the one that starts before (or at) line_number and ends after (or at) line_number
-        # and has the largest start line (innermost).
+        """Find the smallest definition block containing the line.
 
-        candidate = None
-        for b in self.blocks:
+        Bisect to the last block starting at or before the line, then
+        walk outwards until one actually spans it — the first hit going
+        backwards has the largest start, i.e. the innermost block. For
+        the typical changed line this is a couple of steps instead of a
+        scan over every block in the file.
+        """
+        idx = bisect.bisect_right(self._starts, line_number) - 1
+        for j in range(idx, -1, -1):
+            b = self.blocks[j]
             if b.start <= line_number <= b.end:
-                if candidate is None or b.start > candidate.start:
-                    candidate = b
-        return candidate
+                return b
+        return None
 
     def get_block_content(self, block: BlockInfo) -> str:
         # Convert 1-based to 0-based for slicing
         return "\n".join(self.lines[block.start-1 : block.end])
 
+class GitCatFileBatch:
+    """Persistent 'git cat-file --batch' process for blob reads.
+
+    One long-running child answers every content lookup over a pipe
+    instead of spawning 'git show' per file — for a PR touching N files
+    that's one fork instead of N. Children are per-thread (thread-local)
+    since the batch protocol is stateful on the pipe.
+    """
+
+    def __init__(self, repo_dir):
+        self.repo_dir = str(repo_dir)
+        self._local = threading.local()
+
+    def _proc(self) -> Optional[subprocess.Popen]:
+        proc = getattr(self._local, "proc", None)
+        if proc is None or proc.poll() is not None:
+            try:
+                proc = subprocess.Popen(
+                    ["git", "cat-file", "--batch"],
+                    cwd=self.repo_dir,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError:
+                return None
+            self._local.proc = proc
+        return proc
+
+    def read(self, rev: str, filepath: str) -> Optional[str]:
+        """Read a blob at rev:filepath. Returns None when missing."""
+        proc = self._proc()
+        if proc is None:
+            return None
+        try:
+            proc.stdin.write(f"{rev}:{filepath}\n".encode())
+            proc.stdin.flush()
+            # Header: "<sha> <type> <size>\n" or "<object> missing\n"
+            header = proc.stdout.readline()
+            if not header or header.rstrip().endswith(b"missing"):
+                return None
+            size = int(header.rsplit(b" ", 1)[1])
+            body = proc.stdout.read(size + 1)[:size]  # Drop trailing LF
+            return body.decode("utf-8", errors="replace")
+        except (OSError, ValueError, IndexError):
+            # Pipe wedged; drop the child so the next call respawns it
+            self._local.proc = None
+            return None
+
+    def close(self):
+        proc = getattr(self._local, "proc", None)
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.stdin.close()
+                proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                proc.kill()
+
+    def __del__(self):
+        self.close()
+
+
 # --- Review Logic ---
 class AgenticReviewer:
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, concurrency: int = 4):
         self.jules = get_jules_client(api_key)
         self.gh = GitHubClient()
         self.state = ReviewState(STATE_FILE)
-
-    def get_context_for_changes(self, file_content: str, changed_lines: List[int]) -> List[Tuple[BlockInfo, str]]:
+        self.concurrency = max(1, concurrency)
+        # Per-(revision, path) memos: keys include the immutable head
+        # SHA, so entries never go stale and repeat lookups across
+        # blocks/PRs skip the git subprocess entirely.
+        self._content_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        self._pr_diff_cache: Dict[Tuple[str, str], Dict[str, str]] = {}
+        self._parser_cache: Dict[Tuple[str, str], SimpleTSParser] = {}
+        self._catfile = GitCatFileBatch(HRM_REPO_DIR)
+
+    def _file_content(self, rev: str, filepath: str) -> Optional[str]:
+        """Memoized blob read keyed by (rev, path).
+
+        Served by the persistent cat-file child; falls back to a one-off
+        'git show' subprocess if the batch pipe is unavailable.
+        """
+        key = (rev, filepath)
+        if key not in self._content_cache:
+            content = self._catfile.read(rev, filepath)
+            if content is None:
+                content = self.gh.get_file_content(rev, filepath)
+            self._content_cache[key] = content
+        return self._content_cache[key]
+
+    _DIFF_HEADER = re.compile(r'^diff --git a/.* b/(.*)$', re.MULTILINE)
+
+    def _pr_diffs(self, base: str, head: str) -> Dict[str, str]:
+        """Fetch the whole PR diff once and split it per file.
+
+        One 'git diff base...head' replaces a subprocess per changed
+        file (and doubles as the changed-file listing). Memoized by
+        (base, head) — head is an immutable SHA, so entries never go
+        stale.
+        """
+        key = (base, head)
+        if key not in self._pr_diff_cache:
+            full = self.gh.get_diff(base, head) or ""
+            diffs: Dict[str, str] = {}
+            headers = list(self._DIFF_HEADER.finditer(full))
+            for i, match in enumerate(headers):
+                end = (headers[i + 1].start() if i + 1 < len(headers)
+                       else len(full))
+                diffs[match.group(1)] = full[match.start():end]
+            self._pr_diff_cache[key] = diffs
+        return self._pr_diff_cache[key]
+
+    def _parser(self, rev: str, filepath: str,
+                file_content: str) -> SimpleTSParser:
+        """Memoized SimpleTSParser keyed by (rev, path).
+
+        Parsing a large TSX file is the priciest pure-Python step here;
+        the key includes the immutable revision, so a file revisited
+        across blocks or re-runs in one process parses once.
+        """
+        key = (rev, filepath)
+        if key not in self._parser_cache:
+            self._parser_cache[key] = SimpleTSParser(file_content)
+        return self._parser_cache[key]
+
+    @staticmethod
+    def _contiguous_ranges(lines: List[int]):
+        """Collapse line numbers into inclusive (lo, hi) runs."""
+        for _, group in itertools.groupby(
+            enumerate(sorted(lines)), lambda pair: pair[1] - pair[0]
+        ):
+            run = [line for _, line in group]
+            yield run[0], run[-1]
+
+    def get_context_for_changes(self, file_content: str, changed_lines: List[int],
+                                rev: str = "", filepath: str = "") -> List[Tuple[BlockInfo, str]]:
         """
         Groups changed lines by their enclosing block and extracts content.
         Returns list of (BlockInfo, block_content).
         """
-        parser = SimpleTSParser(file_content)
+        parser = (self._parser(rev, filepath, file_content)
+                  if rev and filepath else SimpleTSParser(file_content))
         contexts = {} # Map block_start -> (BlockInfo, set(changed_lines))
 
-        for line in changed_lines:
-            block = parser.get_enclosing_block(line)
-            if block:
-                if block.start not in contexts:
-                    contexts[block.start] = (block, set())
-                contexts[block.start][1].add(line)
-            else:
-                # Top-level change or unable to parse block
-                pass
+        def assign(block: BlockInfo, lines) -> None:
+            if block.start not in contexts:
+                contexts[block.start] = (block, set())
+            contexts[block.start][1].update(lines)
+
+        # Diff hunks yield contiguous runs of changed lines; one block
+        # lookup per run replaces one per line. When a run spills past
+        # the block that encloses its first line, fall back to per-line
+        # lookups for just that run.
+        for lo, hi in self._contiguous_ranges(changed_lines):
+            block = parser.get_enclosing_block(lo)
+            if block and block.end >= hi:
+                assign(block, range(lo, hi + 1))
+                continue
+            for line in range(lo, hi + 1):
+                block = parser.get_enclosing_block(line)
+                if block:
+                    assign(block, (line,))
+                # else: top-level change or unable to parse block
 
         # Return unique blocks
         results = []
@@ -224,40 +402,57 @@ class AgenticReviewer:
 
         logger.info(f"🔍 Reviewing PR #{pr_number} ({head_branch} -> {base_branch})")
 
-        # Ensure we have the latest refs
-        self.gh.fetch()
-
-        # Identify changed files
-        changed_files = self.gh.get_changed_files(f"origin/{base_branch}", f"origin/{head_branch}")
+        # One whole-PR diff gives both the changed-file listing and the
+        # per-file diff text. head_oid (not origin/<branch>) keys all
+        # subsequent lookups: it's the revision we actually reviewed and
+        # it makes the memo caches immune to the branch moving.
+        base_ref = f"origin/{base_branch}"
+        file_diffs = self._pr_diffs(base_ref, head_oid)
 
-        reviews = []
+        # Build the full work list first, then fan the Jules calls out:
+        # each ask_jules blocks on monitor_session for minutes, so the
+        # wall-clock win is ~min(concurrency, blocks).
+        worklist = []
 
-        for filepath in changed_files:
+        for filepath, diff in file_diffs.items():
             if filepath in IGNORE_FILES: continue
             _, ext = os.path.splitext(filepath)
             if ext not in SUPPORTED_EXTENSIONS: continue
 
             logger.info(f"  Analyzing {filepath}...")
 
-            file_content = self.gh.get_file_content(f"origin/{head_branch}", filepath)
-            diff = self.gh.get_diff(f"origin/{base_branch}", f"origin/{head_branch}", filepath)
+            file_content = self._file_content(head_oid, filepath)
 
             if not file_content or not diff:
                 continue
 
             changed_lines = self.parse_diff_changed_lines(diff)
-            blocks = self.get_context_for_changes(file_content, changed_lines)
+            blocks = self.get_context_for_changes(
+                file_content, changed_lines, rev=head_oid, filepath=filepath
+            )
 
             if not blocks:
                 logger.info("    No specific method context found for changes (top-level?). Skipping granular review.")
                 continue
 
             for block, method_content in blocks:
-                logger.info(f"    🤖 Reviewing block: {block.header[:50]}...")
+                worklist.append((filepath, block, method_content, diff, file_content))
 
-                suggestion = self.ask_jules(file_content, method_content, diff, filepath)
-                if suggestion:
-                    reviews.append(f"### {filepath}\n**Method:** `{block.header.strip()}`\n\n{suggestion}")
+        reviews = []
+        if worklist:
+            workers = min(self.concurrency, len(worklist))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = []
+                for filepath, block, method_content, diff, file_content in worklist:
+                    logger.info(f"    🤖 Reviewing block: {block.header[:50]}...")
+                    futures.append(pool.submit(
+                        self.ask_jules, file_content, method_content, diff, filepath
+                    ))
+                # Collect in submission order so the comment is deterministic
+                for (filepath, block, _, _, _), future in zip(worklist, futures):
+                    suggestion = future.result()
+                    if suggestion:
+                        reviews.append(f"### {filepath}\n**Method:** `{block.header.strip()}`\n\n{suggestion}")
 
         if reviews:
             self.post_reviews(pr_number, reviews, head_oid)
@@ -343,17 +538,41 @@ def main():
     parser = argparse.ArgumentParser(description="Agentic Code Review")
     parser.add_argument("--pr", type=int, help="Specific PR number to review")
     parser.add_argument("--all", action="store_true", help="Review all open PRs")
+    parser.add_argument(
+        "--concurrency", type=int, default=4,
+        help="Max concurrent Jules review sessions (default: 4)"
+    )
     args = parser.parse_args()
 
-    reviewer = AgenticReviewer()
+    reviewer = AgenticReviewer(concurrency=args.concurrency)
+
+    # Fetch once up front; process_pr assumes refs are current, and a
+    # fetch per PR in the --all loop was pure repetition.
+    reviewer.gh.fetch()
 
     if args.pr:
         reviewer.process_pr(args.pr)
     else:
-        # Default to all open PRs if not specified
+        # Default to all open PRs if not specified. PRs are independent,
+        # so review them concurrently — each one is dominated by waiting
+        # on Jules sessions, not local work. The memo caches are safe to
+        # share (dict writes hold the GIL) and ReviewState locks its
+        # save, so cross-PR interleaving is fine.
         prs = reviewer.gh.list_prs(state="open")
-        for pr in prs:
-            reviewer.process_pr(pr['number'])
+        if prs:
+            workers = min(8, len(prs))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(reviewer.process_pr, pr['number'])
+                    for pr in prs
+                ]
+                for pr, future in zip(prs, futures):
+                    try:
+                        future.result()
+                    except Exception:
+                        logger.exception(
+                            f"Review of PR #{pr['number']} failed"
+                        )
 
 if __name__ == "__main__":
     main()
@@ -6,9 +6,13 @@ Includes optional Gemini LLM auditing if GEMINI_KEY is present.
 """
 
 import argparse
+import bisect
+import concurrent.futures
+import hashlib
 import json
 import os
 import re
+import subprocess
 import sys
 import time
 import requests
@@ -31,12 +35,40 @@ except ImportError:
     logger = logging.getLogger("audit_codebase")
     HRM_REPO_DIR = Path("hrm")
 
+# Audit patterns, compiled once at import and shared by every auditor
+# instance rather than recompiled per __init__. Bytes patterns: files
+# are read as bytes and every pattern is pure ASCII, so the per-file
+# UTF-8 decode (a full copy plus validation) is skipped entirely.
+USE_CLIENT_RE = re.compile(rb'^\s*["\']use client["\']', re.MULTILINE)
+
+# All per-line patterns fused into one alternation: a single automaton
+# pass over the whole file replaces one regex call per pattern per line.
+# Matches dispatch to auditors by named group (see scan_file).
+COMBINED_RE = re.compile(
+    rb'(?P<sx>\bsx=\{)'
+    rb'|(?P<var>\bvar\s+)'
+    rb'|(?P<log>console\.log\()'
+    rb'|(?P<todo>//\s*TODO)'
+    rb'|(?P<env>===\s*process\.env\.)'
+)
+NEWLINE_RE = re.compile(rb'\n')
+
 class BaseAuditor:
+    # File extensions this auditor applies to
+    EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+    # Named groups of COMBINED_RE this auditor responds to
+    GROUPS = frozenset()
+
     def __init__(self, name: str):
         self.name = name
         self.findings = []
 
-    def audit(self, filepath: str, content: str):
+    def audit(self, filepath: str, content: bytes):
+        """Whole-file checks; per-line patterns dispatch via handle()."""
+        pass
+
+    def handle(self, group: str, filepath: str, line_num: int):
+        """React to one COMBINED_RE match belonging to this auditor."""
         raise NotImplementedError
 
     def add_finding(self, filepath: str, message: str, line_num: int = 0):
@@ -48,62 +80,48 @@ class BaseAuditor:
         })
 
 class FrontendAuditor(BaseAuditor):
+    EXTENSIONS = ('.tsx', '.jsx', '.ts', '.js')
+    GROUPS = frozenset({'sx'})
+
     def __init__(self):
         super().__init__("Frontend")
-        self.use_client_re = re.compile(r'^\s*["\']use client["\']', re.MULTILINE)
-        self.sx_prop_re = re.compile(r'\bsx=\{')
 
-    def audit(self, filepath: str, content: str):
-        if not filepath.endswith(('.tsx', '.jsx', '.ts', '.js')):
+    def audit(self, filepath: str, content: bytes):
+        if not filepath.endswith(self.EXTENSIONS):
             return
 
         # Check for 'use client' abuse
-        if "utils/" in filepath and self.use_client_re.search(content):
+        if "utils/" in filepath and USE_CLIENT_RE.search(content):
             self.add_finding(filepath, "'use client' found in utils file. Utilities should generally be isomorphic.")
 
-        # Check for 'sx' prop usage (performance)
-        lines = content.splitlines()
-        for i, line in enumerate(lines):
-            if self.sx_prop_re.search(line):
-                self.add_finding(filepath, "Avoid using 'sx' prop for performance. Use `styled` components or CSS modules.", i + 1)
+    def handle(self, group: str, filepath: str, line_num: int):
+        self.add_finding(filepath, "Avoid using 'sx' prop for performance. Use `styled` components or CSS modules.", line_num)
 
 class SecurityAuditor(BaseAuditor):
+    EXTENSIONS = ('.ts', '.js', '.tsx')
+    GROUPS = frozenset({'env'})
+
     def __init__(self):
         super().__init__("Security")
-        self.unsafe_comparison_re = re.compile(r'===\s*process\.env\.')
-        self.timing_safe_re = re.compile(r'crypto\.timingSafeEqual')
 
-    def audit(self, filepath: str, content: str):
-        if not filepath.endswith(('.ts', '.js', '.tsx')):
-            return
-
-        lines = content.splitlines()
-        for i, line in enumerate(lines):
-            if self.unsafe_comparison_re.search(line):
-                self.add_finding(filepath, "Potential timing attack. Use `crypto.timingSafeEqual` for secret comparisons.", i + 1)
+    def handle(self, group: str, filepath: str, line_num: int):
+        self.add_finding(filepath, "Potential timing attack. Use `crypto.timingSafeEqual` for secret comparisons.", line_num)
 
 class HygieneAuditor(BaseAuditor):
+    EXTENSIONS = ('.ts', '.js', '.tsx', '.jsx')
+    GROUPS = frozenset({'var', 'log', 'todo'})
+
     def __init__(self):
         super().__init__("Hygiene")
-        self.var_re = re.compile(r'\bvar\s+')
-        self.console_log_re = re.compile(r'console\.log\(')
-        self.todo_re = re.compile(r'//\s*TODO')
-
-    def audit(self, filepath: str, content: str):
-        if not filepath.endswith(('.ts', '.js', '.tsx', '.jsx')):
-            return
 
-        lines = content.splitlines()
-        for i, line in enumerate(lines):
-            if self.var_re.search(line):
-                self.add_finding(filepath, "Use `let` or `const` instead of `var`.", i + 1)
-
-            if self.console_log_re.search(line):
-                if "scripts/" not in filepath and "test" not in filepath:
-                     self.add_finding(filepath, "Avoid `console.log` in production code. Use a logger.", i + 1)
-
-            if self.todo_re.search(line):
-                pass # TODO: Implement strict TODO checking
+    def handle(self, group: str, filepath: str, line_num: int):
+        if group == 'var':
+            self.add_finding(filepath, "Use `let` or `const` instead of `var`.", line_num)
+        elif group == 'log':
+            if "scripts/" not in filepath and "test" not in filepath:
+                self.add_finding(filepath, "Avoid `console.log` in production code. Use a logger.", line_num)
+        elif group == 'todo':
+            pass # TODO: Implement strict TODO checking
 
 class GeminiAuditor(BaseAuditor):
     def __init__(self):
@@ -112,13 +130,18 @@ class GeminiAuditor(BaseAuditor):
         self.model = "gemini-2.0-flash-lite-preview-02-05"
         self.url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent"
 
-    def audit(self, filepath: str, content: str):
+    def audit(self, filepath: str, content: bytes):
         if not self.api_key:
             return
 
         if not filepath.endswith(('.ts', '.tsx', '.js', '.jsx')):
             return
 
+        # The prompt needs text; decode here, only for the few files
+        # Gemini actually sees
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', errors='replace')
+
         logger.info(f"🤖 Gemini auditing {filepath}...")
 
         prompt = f"""
@@ -166,12 +189,131 @@ Code:
 
 def scan_file(filepath: str, auditors: List[BaseAuditor]):
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        with open(filepath, 'rb') as f:
+            content = f.read()
+    except Exception as e:
+        logger.warning(f"Failed to scan {filepath}: {e}")
+        return
+    scan_content(filepath, content, auditors)
+
+def scan_content(filepath: str, content: bytes, auditors: List[BaseAuditor]):
+    # Whole-file checks first
+    for auditor in auditors:
+        auditor.audit(filepath, content)
+
+    # Then one fused pass over the content for all per-line patterns,
+    # dispatching each match by named group. Line numbers are computed
+    # lazily (matches are rare relative to lines) via bisect over the
+    # line-start offsets.
+    dispatch: Dict[str, List[BaseAuditor]] = {}
+    for auditor in auditors:
+        if auditor.GROUPS and filepath.endswith(auditor.EXTENSIONS):
+            for group in auditor.GROUPS:
+                dispatch.setdefault(group, []).append(auditor)
+    if not dispatch:
+        return
+
+    line_starts = None
+    seen = set()
+    for match in COMBINED_RE.finditer(content):
+        handlers = dispatch.get(match.lastgroup)
+        if not handlers:
+            continue
+        if line_starts is None:
+            line_starts = [0] + [nl.end() for nl in NEWLINE_RE.finditer(content)]
+        line_num = bisect.bisect_right(line_starts, match.start())
+        key = (match.lastgroup, line_num)
+        if key in seen:
+            # The old per-line re.search reported each pattern at most
+            # once per line; keep that.
+            continue
+        seen.add(key)
+        for auditor in handlers:
+            auditor.handle(match.lastgroup, filepath, line_num)
+
+def _discover_files() -> List[str]:
+    """Enumerate candidate source files under the hrm repo.
+
+    Asks git's index first: one subprocess returns exactly the tracked
+    source files — ignored trees like node_modules excluded for free —
+    instead of walking thousands of directories. Falls back to the
+    pruned os.walk when git is unavailable or this isn't a repo.
+    """
+    try:
+        proc = subprocess.run(
+            ["git", "ls-files", "-z", "--",
+             "*.ts", "*.tsx", "*.js", "*.jsx"],
+            cwd=HRM_REPO_DIR, capture_output=True, check=True,
+        )
+        return [
+            os.path.join(str(HRM_REPO_DIR), path.decode())
+            for path in proc.stdout.split(b"\0") if path
+        ]
+    except (OSError, subprocess.CalledProcessError):
+        pass
+
+    files = []
+    for root, dirs, names in os.walk(HRM_REPO_DIR):
+        # Prune directories
+        dirs[:] = [d for d in dirs if d not in ['node_modules', '.next', '.git', 'dist', 'build']]
+        for name in names:
+            if name.endswith(('.ts', '.tsx', '.js', '.jsx')):
+                files.append(os.path.join(root, name))
+    return files
+
+
+# Per-file findings cache across runs: content hash -> findings, so an
+# incremental audit only pays the pattern scan for files that changed.
+# Bump the version whenever audit logic changes to invalidate entries.
+AUDIT_CACHE_FILE = Path(".cache/audit.json")
+AUDIT_CACHE_VERSION = 1
+
+
+def _load_audit_cache() -> Dict[str, Any]:
+    try:
+        with open(AUDIT_CACHE_FILE, 'rb') as f:
+            data = json.load(f)
+        if data.get("version") == AUDIT_CACHE_VERSION:
+            return data.get("files", {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def _save_audit_cache(files: Dict[str, Any]) -> None:
+    try:
+        AUDIT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = AUDIT_CACHE_FILE.with_suffix(".json.tmp")
+        with open(tmp, 'w') as f:
+            json.dump({"version": AUDIT_CACHE_VERSION, "files": files}, f)
+        os.replace(tmp, AUDIT_CACHE_FILE)
+    except OSError as e:
+        logger.warning(f"Could not write audit cache: {e}")
+
+
+def _scan_one(job) -> tuple:
+    """Worker: scan one file unless its cached findings are still valid.
+
+    Takes (filepath, cached_entry) and returns (filepath, content_hash,
+    findings). Module-level (and auditors constructed locally) so it
+    pickles cleanly into ProcessPoolExecutor workers.
+    """
+    filepath, cached = job
+    try:
+        with open(filepath, 'rb') as f:
             content = f.read()
-            for auditor in auditors:
-                auditor.audit(filepath, content)
     except Exception as e:
         logger.warning(f"Failed to scan {filepath}: {e}")
+        return filepath, None, []
+
+    digest = hashlib.sha1(content).hexdigest()
+    if cached and cached.get("hash") == digest:
+        return filepath, digest, cached.get("findings", [])
+
+    auditors = [FrontendAuditor(), SecurityAuditor(), HygieneAuditor()]
+    scan_content(filepath, content, auditors)
+    return filepath, digest, [f for auditor in auditors for f in auditor.findings]
+
 
 def main():
     parser = argparse.ArgumentParser(description="Audit codebase for patterns.")
@@ -181,50 +323,63 @@ def main():
 
     args = parser.parse_args()
 
-    auditors = [
-        FrontendAuditor(),
-        SecurityAuditor(),
-        HygieneAuditor()
-    ]
-
-    # Add Gemini Auditor if Key is present and not disabled
-    if os.environ.get("GEMINI_KEY") and not args.no_llm:
-        auditors.append(GeminiAuditor())
-    elif not args.no_llm:
+    # Gemini runs in-process after the pattern scan; it is network-bound
+    # and rate-limited, so it gains nothing from the worker pool.
+    use_gemini = bool(os.environ.get("GEMINI_KEY")) and not args.no_llm
+    if not use_gemini and not args.no_llm:
         logger.info("Gemini Auditor skipped (GEMINI_KEY not found)")
 
-    files_to_scan = []
     if args.files:
         files_to_scan = [f for f in args.files if os.path.isfile(f)]
     else:
         # Scan everything in hrm/ (excluding node_modules, etc)
-        start_dir = HRM_REPO_DIR
-        for root, dirs, files in os.walk(start_dir):
-            # Prune directories
-            dirs[:] = [d for d in dirs if d not in ['node_modules', '.next', '.git', 'dist', 'build']]
-            for file in files:
-                if file.endswith(('.ts', '.tsx', '.js', '.jsx')):
-                     files_to_scan.append(os.path.join(root, file))
+        files_to_scan = _discover_files()
 
     logger.info(f"Scanning {len(files_to_scan)} files...")
 
     # If using Gemini, limit the number of files if we are scanning the whole repo to avoid rate limits/costs
     # But if specific files were passed (like from process_pr), we assume it's a small set.
-    if any(isinstance(a, GeminiAuditor) for a in auditors) and not args.files:
+    if use_gemini and not args.files:
         logger.warning("Running Gemini on ENTIRE repo. This might be slow and costly. Limiting to first 5 files.")
         files_to_scan = files_to_scan[:5]
 
-    for filepath in files_to_scan:
-        # Use relative path for reporting if possible
+    # Pattern scanning is pure and per-file independent — fan it out
+    # across processes for full-repo runs. map() preserves input order;
+    # chunksize amortizes the IPC cost over many small files. The cache
+    # lets workers skip the scan for files unchanged since the last run.
+    cache = _load_audit_cache()
+    jobs = [(filepath, cache.get(filepath)) for filepath in files_to_scan]
+    new_cache = dict(cache)
+    all_findings = []
+
+    def collect(result):
+        filepath, digest, findings = result
+        all_findings.extend(findings)
+        if digest:
+            new_cache[filepath] = {"hash": digest, "findings": findings}
+
+    if len(jobs) > 1:
         try:
-            rel_path = os.path.relpath(filepath, os.getcwd())
-        except ValueError:
-            rel_path = filepath
-        scan_file(filepath, auditors)
+            with concurrent.futures.ProcessPoolExecutor() as pool:
+                for result in pool.map(_scan_one, jobs, chunksize=32):
+                    collect(result)
+        except Exception as e:
+            logger.warning(f"Parallel scan failed ({e}); scanning serially.")
+            all_findings = []
+            new_cache = dict(cache)
+            for job in jobs:
+                collect(_scan_one(job))
+    else:
+        for job in jobs:
+            collect(_scan_one(job))
 
-    all_findings = []
-    for auditor in auditors:
-        all_findings.extend(auditor.findings)
+    _save_audit_cache(new_cache)
+
+    if use_gemini:
+        gemini = GeminiAuditor()
+        for filepath in files_to_scan:
+            scan_file(filepath, [gemini])
+        all_findings.extend(gemini.findings)
 
     if args.json:
         print(json.dumps(all_findings, indent=2))
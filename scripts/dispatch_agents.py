@@ -3,9 +3,13 @@
 Dispatch AI Agents to audit the HRM codebase and file GitHub issues.
 """
 
+import json
+import mmap
 import sys
 import re
 import os
+import shutil
+import subprocess
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 
@@ -16,6 +20,109 @@ from github_client import GitHubClient
 
 logger = setup_logging("dispatch_agents")
 
+# Compiled-pattern cache for _grep_file, keyed by pattern string, so
+# repeated greps with the same pattern skip re.compile entirely.
+_PATTERN_CACHE: Dict[str, re.Pattern] = {}
+
+
+def _compiled(pattern: str) -> re.Pattern:
+    # Compiled as bytes: the grep patterns are pure ASCII and files are
+    # read as bytes, skipping the UTF-8 decode of lines nobody keeps
+    compiled = _PATTERN_CACHE.get(pattern)
+    if compiled is None:
+        compiled = _PATTERN_CACHE[pattern] = re.compile(pattern.encode())
+    return compiled
+
+
+def _file_contains(path: Path, needle: bytes) -> bool:
+    """True when the file contains the byte needle.
+
+    mmap lets the kernel page the file in on demand and find() stops at
+    the first hit — no full read into the heap and no UTF-8 decode.
+    Files below one page skip the mmap setup and are read directly.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return False
+        if size < 4096:
+            return needle in os.read(fd, size)
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        try:
+            return mm.find(needle) != -1
+        finally:
+            mm.close()
+    except (OSError, ValueError):
+        return False
+    finally:
+        os.close(fd)
+
+
+def _rg_search(pattern: str, globs: List[str],
+               cwd: Path) -> Optional[List[Tuple[str, int, str]]]:
+    """Repo sweep via ripgrep, returning (relpath, line_number, text).
+
+    One rg subprocess walks and scans in parallel native code instead of
+    reading every file into Python. Returns None when rg is unavailable
+    or errors, so callers can fall back to the pure-Python walk.
+    """
+    if shutil.which("rg") is None:
+        return None
+    cmd = ["rg", "--json"]
+    for glob in globs:
+        cmd += ["-g", glob]
+    cmd += ["-e", pattern, "."]
+    try:
+        proc = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    except OSError:
+        return None
+    if proc.returncode > 1:  # 0 = hits, 1 = no hits, >1 = error
+        return None
+
+    hits = []
+    for line in proc.stdout.splitlines():
+        try:
+            obj = json.loads(line)
+        except ValueError:
+            continue
+        if obj.get("type") != "match":
+            continue
+        data = obj["data"]
+        path = data["path"]["text"]
+        if path.startswith("./"):
+            path = path[2:]
+        hits.append((path, data["line_number"],
+                     data["lines"]["text"].rstrip("\n")))
+    return hits
+
+
+def _rg_files(needle: str, globs: List[str],
+              cwd: Path) -> Optional[List[str]]:
+    """List files containing a literal string via 'rg -l -F'.
+
+    --sort path keeps the output deterministic like an rglob walk.
+    Returns None when rg is unavailable, for a Python fallback.
+    """
+    if shutil.which("rg") is None:
+        return None
+    cmd = ["rg", "-l", "-F", "--sort", "path"]
+    for glob in globs:
+        cmd += ["-g", glob]
+    cmd += [needle, "."]
+    try:
+        proc = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    except OSError:
+        return None
+    if proc.returncode > 1:
+        return None
+    return [p[2:] if p.startswith("./") else p
+            for p in proc.stdout.splitlines()]
+
+
 class Auditor:
     def __init__(self, name: str, client: GitHubClient):
         self.name = name
@@ -26,16 +133,21 @@ class Auditor:
         """Performs the audit and returns (title, body)."""
         raise NotImplementedError
 
-    def run(self):
+    def run(self, existing_titles: Optional[set] = None):
         title, body = self.audit()
         logger.info(f"Agent {self.name} finished audit. Title: {title}")
 
-        # Check if issue already exists
-        existing_issues = self.client.list_issues(state="open", limit=100)
-        for issue in existing_issues:
-            if issue['title'] == title:
-                logger.info(f"Issue '{title}' already exists (#{issue['number']}). Skipping.")
-                return
+        # Check if issue already exists. main() fetches the open-issue
+        # titles once and shares them, so four auditors cost one API
+        # round trip instead of four.
+        if existing_titles is None:
+            existing_titles = {
+                i['title']
+                for i in self.client.list_issues(state="open", limit=100)
+            }
+        if title in existing_titles:
+            logger.info(f"Issue '{title}' already exists. Skipping.")
+            return
 
         logger.info(f"Creating issue '{title}'...")
         result = self.client.create_issue(title, body)
@@ -51,11 +163,13 @@ class Auditor:
         if not self._check_file_exists(filepath):
             return []
         found = []
+        compiled = _compiled(pattern)
         try:
-            with open(self.repo_dir / filepath, 'r', encoding='utf-8') as f:
+            with open(self.repo_dir / filepath, 'rb') as f:
                 for i, line in enumerate(f, 1):
-                    if re.search(pattern, line):
-                        found.append(f"{filepath}:{i}: {line.strip()}")
+                    if compiled.search(line):
+                        text = line.decode('utf-8', errors='replace')
+                        found.append(f"{filepath}:{i}: {text.strip()}")
         except Exception as e:
             logger.warning(f"Error reading {filepath}: {e}")
         return found
@@ -75,14 +189,14 @@ class FrontendAuditor(Auditor):
         client_components = []
         app_dir = self.repo_dir / "app"
         if app_dir.exists():
-            for p in app_dir.rglob("*.tsx"):
-                try:
-                    content = p.read_text(encoding='utf-8')
-                    if 'use client' in content:
+            rel_files = _rg_files("use client", ["*.tsx"], app_dir)
+            if rel_files is not None:
+                client_components = [f"app/{f}" for f in rel_files]
+            else:
+                for p in app_dir.rglob("*.tsx"):
+                    if _file_contains(p, b"use client"):
                         rel_path = p.relative_to(self.repo_dir)
                         client_components.append(str(rel_path))
-                except:
-                    pass
 
         if client_components:
             for cc in client_components[:5]: # Limit to 5 examples
@@ -93,14 +207,21 @@ class FrontendAuditor(Auditor):
         # 2. Material-UI Optimization
         body_sections.append("## Material-UI Optimization")
         sx_usage = []
+        sx_capped = False
         components_dir = self.repo_dir / "components"
         if components_dir.exists():
+            # The report only shows a count and 3 example paths, so stop
+            # walking once the count is large enough to say "100+"
             for p in components_dir.rglob("*.tsx"):
-                if "sx={" in p.read_text(encoding='utf-8', errors='ignore'):
+                if _file_contains(p, b"sx={"):
                     sx_usage.append(str(p.relative_to(self.repo_dir)))
+                    if len(sx_usage) >= 100:
+                        sx_capped = True
+                        break
 
         if sx_usage:
-            body_sections.append(f"Found `sx` prop usage in {len(sx_usage)} files. Consider extracting to styled-components for performance if critical.")
+            count = f"{len(sx_usage)}+" if sx_capped else str(len(sx_usage))
+            body_sections.append(f"Found `sx` prop usage in {count} files. Consider extracting to styled-components for performance if critical.")
             body_sections.append("Example files:")
             for f in sx_usage[:3]:
                 body_sections.append(f"- `{f}`")
@@ -125,17 +246,25 @@ class QAAuditor(Auditor):
 
         tests_dir = self.repo_dir / "tests"
         if tests_dir.exists():
-            for p in tests_dir.rglob("*.ts"):
-                rel_path = str(p.relative_to(self.repo_dir))
-
+            # One rg sweep per pattern over all of tests/, instead of a
+            # Python read of every file per pattern
+            checks = [
                 # Check for timeouts
-                timeouts.extend(self._grep_file(rel_path, r"(page\.waitForTimeout|setTimeout|setInterval)"))
-
+                (r"(page\.waitForTimeout|setTimeout|setInterval)", timeouts),
                 # Check for random inputs
-                random_inputs.extend(self._grep_file(rel_path, r"Math\.random"))
-
+                (r"Math\.random", random_inputs),
                 # Check for serial mode (potential isolation issue)
-                isolation_issues.extend(self._grep_file(rel_path, r"test\.describe\.serial"))
+                (r"test\.describe\.serial", isolation_issues),
+            ]
+            for pattern, sink in checks:
+                hits = _rg_search(pattern, ["tests/**/*.ts"], self.repo_dir)
+                if hits is not None:
+                    sink.extend(f"{path}:{num}: {text.strip()}"
+                                for path, num, text in hits)
+                else:
+                    for p in tests_dir.rglob("*.ts"):
+                        rel_path = str(p.relative_to(self.repo_dir))
+                        sink.extend(self._grep_file(rel_path, pattern))
 
         if timeouts:
             body_sections.append("Found potential timing assumptions (waitForTimeout/setTimeout):")
@@ -197,9 +326,15 @@ class CodeHygieneAuditor(Auditor):
         vars_found = []
         app_dir = self.repo_dir / "app"
         if app_dir.exists():
-            for p in app_dir.rglob("*.ts*"):
-                 found = self._grep_file(str(p.relative_to(self.repo_dir)), r"var\s+")
-                 vars_found.extend(found)
+            # One rg sweep over app/ instead of a Python read per file
+            hits = _rg_search(r"var\s+", ["app/**/*.ts*"], self.repo_dir)
+            if hits is not None:
+                vars_found = [f"{path}:{num}: {text.strip()}"
+                              for path, num, text in hits]
+            else:
+                for p in app_dir.rglob("*.ts*"):
+                    found = self._grep_file(str(p.relative_to(self.repo_dir)), r"var\s+")
+                    vars_found.extend(found)
 
         if vars_found:
             body_sections.append("Found usage of `var` (prefer `let`/`const`):")
@@ -258,6 +393,8 @@ def main():
         DocumentationAuditor("Docs", client)
     ]
 
+    existing_titles = None
+
     for auditor in auditors:
         if args.auditor == "all" or args.auditor.lower() in auditor.name.lower():
             logger.info(f"Running {auditor.name} Auditor...")
@@ -270,7 +407,12 @@ def main():
                     print(body)
                     print("-----------------------------")
                 else:
-                    auditor.run()
+                    if existing_titles is None:
+                        existing_titles = {
+                            i['title']
+                            for i in client.list_issues(state="open", limit=100)
+                        }
+                    auditor.run(existing_titles)
             except Exception as e:
                 logger.error(f"Error running {auditor.name}: {e}")
 
@@ -27,6 +27,65 @@ def get_open_issues(repo_path):
     command = ["gh", "issue", "list", "--state", "open", "--json", "number"]
     return run_command(command, repo_path)
 
+# One query returns every open issue together with its cross-references,
+# so checking N issues costs ceil(N/100) API calls instead of one
+# subprocess + round trip per issue.
+ISSUE_TIMELINE_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, states: OPEN, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        timelineItems(itemTypes: CROSS_REFERENCED_EVENT, first: 10) {
+          nodes { source { __typename } }
+        }
+      }
+    }
+  }
+}
+"""
+
+def get_issues_without_linked_pr(repo_path):
+    """Lists open issue numbers with no linked PR, batched via GraphQL.
+
+    Returns None when the query fails (e.g. gh too old), so the caller
+    can fall back to the per-issue probes.
+    """
+    logging.info("Fetching open issues and linked PRs...")
+    numbers = []
+    cursor = None
+    while True:
+        command = [
+            "gh", "api", "graphql",
+            # gh expands {owner}/{repo} from the current repository
+            "-F", "owner={owner}", "-F", "name={repo}",
+            "-f", f"query={ISSUE_TIMELINE_QUERY}",
+        ]
+        if cursor:
+            command += ["-F", f"cursor={cursor}"]
+        data = run_command(command, repo_path)
+        try:
+            issues = data["data"]["repository"]["issues"]
+            nodes = issues["nodes"]
+            page_info = issues["pageInfo"]
+        except (KeyError, TypeError):
+            return None
+
+        for node in nodes:
+            linked = any(
+                (item.get("source") or {}).get("__typename") == "PullRequest"
+                for item in node["timelineItems"]["nodes"]
+            )
+            if linked:
+                logging.info(f"  - Found linked PR for issue #{node['number']}")
+            else:
+                numbers.append(node["number"])
+
+        if not page_info.get("hasNextPage"):
+            return numbers
+        cursor = page_info.get("endCursor")
+
 def has_linked_pr(issue_number, repo_path):
     """Checks if an issue has any linked pull requests."""
     logging.info(f"Checking for linked PRs on issue #{issue_number}...")
@@ -65,16 +124,25 @@ def close_and_reopen_issue(issue_number, repo_path):
 
 def main():
     repo_path = "hrm"  # Target the hrm repository in the current workspace
-    
-    issues = get_open_issues(repo_path)
-    if not issues:
-        logging.info("No open issues found.")
+
+    to_recreate = get_issues_without_linked_pr(repo_path)
+    if to_recreate is None:
+        # GraphQL unavailable; fall back to one probe per issue
+        issues = get_open_issues(repo_path)
+        if not issues:
+            logging.info("No open issues found.")
+            return
+        to_recreate = [
+            issue["number"] for issue in issues
+            if not has_linked_pr(issue["number"], repo_path)
+        ]
+
+    if not to_recreate:
+        logging.info("No open issues without linked PRs.")
         return
-        
-    for issue in issues:
-        issue_number = issue["number"]
-        if not has_linked_pr(issue_number, repo_path):
-            close_and_reopen_issue(issue_number, repo_path)
+
+    for issue_number in to_recreate:
+        close_and_reopen_issue(issue_number, repo_path)
             
 if __name__ == "__main__":
     main()
@@ -7,7 +7,12 @@ Can update specific PRs/branches provided as arguments, or all open PRs if no ar
 import sys
 import os
 import argparse
+import concurrent.futures
+import queue
+import random
 import re
+import tempfile
+import time
 from pathlib import Path
 
 # Add parent directory to path to import common modules
@@ -35,6 +40,25 @@ def get_branch_from_arg(client: GitHubClient, arg: str) -> str:
             return None
     return arg
 
+def push_with_retry(client: GitHubClient, branch: str, attempts: int = 3) -> bool:
+    """Push a branch, retrying transient failures with backoff.
+
+    Pushes from several worktrees at once occasionally trip rate limits
+    or flaky connections; backoff with jitter spreads the retries out so
+    the workers do not hammer the remote in lockstep.
+    """
+    delay = 1.0
+    for attempt in range(attempts):
+        if client.push("origin", branch):
+            return True
+        if attempt < attempts - 1:
+            wait = delay + random.uniform(0, delay)
+            logger.warning(f"Push of {branch} failed, retrying in {wait:.1f}s...")
+            time.sleep(wait)
+            delay *= 2
+    return False
+
+
 def update_branch(client: GitHubClient, branch: str) -> bool:
     """Update a single branch with leader."""
     logger.info(f"🔄 Processing {branch}...")
@@ -44,6 +68,17 @@ def update_branch(client: GitHubClient, branch: str) -> bool:
             logger.warning(f"⚠️ Branch {branch} not found locally or on remote, skipping")
             return False
 
+    # If the branch already contains leader there is nothing to merge or
+    # push; this is one local plumbing call (exit 0 = ancestor) against
+    # the refs refreshed by the fetch in main(), so up-to-date branches
+    # skip the checkout/merge/push entirely.
+    if client.branch_exists(branch, remote=True) and client.run_cmd(
+        ["git", "merge-base", "--is-ancestor", "leader", f"origin/{branch}"],
+        check=False, capture=False,
+    ) is not None:
+        logger.info(f"✅ {branch} already up to date with leader, skipping")
+        return True
+
     # Checkout
     if not client.checkout(branch):
             # Try creating tracking branch
@@ -51,13 +86,20 @@ def update_branch(client: GitHubClient, branch: str) -> bool:
                 logger.error(f"Could not checkout {branch}")
                 return False
 
-    logger.info(f"Pulling {branch}...")
-    client.pull("origin", branch)
+    # origin/{branch} is already current from the single fetch in main(),
+    # so a local ff-only merge replaces the per-branch network pull.
+    if client.branch_exists(branch, remote=True):
+        logger.info(f"Fast-forwarding {branch} to origin/{branch}...")
+        if client.run_cmd(["git", "merge", "--ff-only", f"origin/{branch}"],
+                          check=False, capture=False) is None:
+            # Local commits not on origin — fall back to a merge pull
+            logger.warning(f"⚠️ {branch} has diverged from origin, pulling...")
+            client.pull("origin", branch)
 
     logger.info(f"Merging leader into {branch}...")
     if client.merge("leader"):
         logger.info(f"✅ Merge successful, pushing {branch}...")
-        if client.push("origin", branch):
+        if push_with_retry(client, branch):
                 logger.info(f"✅ Updated {branch}")
                 return True
         else:
@@ -68,10 +110,59 @@ def update_branch(client: GitHubClient, branch: str) -> bool:
         # Merge is already aborted by client.merge if it fails
         return False
 
+def update_branches(client: GitHubClient, branches: list,
+                    jobs: int = 4) -> list:
+    """Update branches, in parallel worktrees when there are several.
+
+    Each worker owns a detached linked worktree (cheap — it shares the
+    object store) plus its own GitHubClient, so checkouts and merges
+    never touch the main working tree or each other. Branches are
+    distinct, so pushes cannot collide on a ref. The work is mostly
+    network-bound (pull/push), which is why threads are enough.
+    """
+    workers = min(max(1, jobs), len(branches))
+    if workers < 2:
+        return [update_branch(client, branch) for branch in branches]
+
+    base = tempfile.mkdtemp(prefix="hrm-update-wt-")
+    idle_clients = queue.Queue()
+    worktrees = []
+    for i in range(workers):
+        path = os.path.join(base, f"wt-{i}")
+        if client.run_cmd(["git", "worktree", "add", "--detach", path],
+                          check=False, capture=False) is None:
+            break
+        worktrees.append(path)
+        idle_clients.put(GitHubClient(repo_path=path))
+
+    if not worktrees:
+        logger.warning("Could not create worktrees; updating serially.")
+        return [update_branch(client, branch) for branch in branches]
+
+    def run_one(branch):
+        worker = idle_clients.get()
+        try:
+            return update_branch(worker, branch)
+        finally:
+            idle_clients.put(worker)
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(worktrees)
+        ) as pool:
+            return list(pool.map(run_one, branches))
+    finally:
+        for path in worktrees:
+            client.run_cmd(["git", "worktree", "remove", "--force", path],
+                           check=False, capture=False)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Update PR branches with changes from leader.")
     parser.add_argument('targets', metavar='TARGET', type=str, nargs='*',
                         help='PR numbers (e.g. 123, #123) or branch names. If empty, updates ALL open PRs.')
+    parser.add_argument('-j', '--jobs', type=int, default=4,
+                        help='Max parallel worktrees for branch updates (default: 4)')
 
     args = parser.parse_args()
 
@@ -87,6 +178,12 @@ def main():
     if not client.pull("origin", "leader"):
         logger.warning("Could not pull latest leader")
 
+    # One fetch updates every origin/* ref; the linked worktrees share
+    # this object store, so per-branch pulls below become local ff merges.
+    logger.info("Fetching origin...")
+    if not client.fetch("origin"):
+        logger.warning("Could not fetch origin")
+
     branches_to_update = []
 
     if args.targets:
@@ -111,14 +208,9 @@ def main():
         logger.info("No branches to update.")
         return
 
-    updated_count = 0
-    failed_count = 0
-
-    for branch in branches_to_update:
-        if update_branch(client, branch):
-            updated_count += 1
-        else:
-            failed_count += 1
+    results = update_branches(client, branches_to_update, jobs=args.jobs)
+    updated_count = sum(1 for ok in results if ok)
+    failed_count = len(results) - updated_count
 
     # Return to leader
     client.checkout("leader")
@@ -9,6 +9,8 @@ import subprocess
 import os
 import time
 import argparse
+import concurrent.futures
+import threading
 from datetime import datetime, timedelta
 
 # Import unified configuration
@@ -25,9 +27,14 @@ CONSOLIDATED_WORKSTREAMS_CSV = "consolidated_workstreams.csv"
 JULES_OPS_SCRIPT = "jules_ops.py"
 
 def run_jules_ops_export():
-    """Run jules_ops.py export to regenerate CSV files."""
+    """Run jules_ops.py export to regenerate CSV files.
+
+    The export's output goes straight to a log file instead of being
+    buffered in memory, so it survives a crashed or killed export and
+    can be tailed while a long export is still running.
+    """
     logger.info("Regenerating CSV data from Jules and GitHub...")
-    
+
     jules_ops_path = WORKSPACE_ROOT / JULES_OPS_SCRIPT
     command = [
         "python3",
@@ -36,25 +43,29 @@ def run_jules_ops_export():
         "--format",
         "csv"
     ]
-    
+
+    log_path = get_data_dir() / "jules_ops_export.log"
     try:
-        result = subprocess.run(
-            command,
-            cwd=str(WORKSPACE_ROOT),
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        
+        with open(log_path, "w", encoding="utf-8") as log_file:
+            result = subprocess.run(
+                command,
+                cwd=str(WORKSPACE_ROOT),
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                check=False
+            )
+
         if result.returncode == 0:
-            logger.info("✅ CSV data regenerated successfully.")
+            logger.info(f"✅ CSV data regenerated successfully (log: {log_path}).")
         else:
             logger.error(f"❌ Failed to regenerate CSV data. Exit code: {result.returncode}")
-            
-        if result.stdout:
-            logger.info(result.stdout)
-        if result.stderr:
-            logger.error(result.stderr)
+            try:
+                with open(log_path, "r", encoding="utf-8") as log_file:
+                    tail = log_file.readlines()[-20:]
+                if tail:
+                    logger.error("Last export output:\n" + "".join(tail))
+            except OSError:
+                pass
     except FileNotFoundError:
         logger.error(f"Error: '{jules_ops_path}' not found.")
     except Exception as e:
@@ -63,46 +74,103 @@ def run_jules_ops_export():
 
 def get_unpublished_sessions():
     """
-    Read the consolidated_workstreams.csv and return a list of completed sessions
+    Read the consolidated_workstreams.csv and yield completed sessions
     that do not have an associated PR.
+
+    A generator keeps memory flat regardless of how large the export
+    grows; callers that need the whole set can wrap it in list().
     """
     data_dir = get_data_dir()
     csv_path = data_dir / CONSOLIDATED_WORKSTREAMS_CSV
-    
-    sessions_to_publish = []
+
     try:
         with open(csv_path, mode="r", newline="", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
+            # Resolve column indices once; csv.reader then skips the
+            # per-row dict construction DictReader would do.
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return
+            session_id_col = header.index("session_id")
+            session_title_col = header.index("session_title")
+            session_state_col = header.index("session_state")
+            pr_id_col = header.index("pr_id")
             for row in reader:
                 # Skip if session is not completed or already has PR
                 if (
-                    row["session_state"] == "COMPLETED"
-                    and not row["pr_id"].strip()
-                    and row["session_id"].strip() != "-"
+                    row[session_state_col] == "COMPLETED"
+                    and not row[pr_id_col].strip()
+                    and row[session_id_col].strip() != "-"
                 ):
-                    sessions_to_publish.append(
-                        {
-                            "session_id": row["session_id"],
-                            "session_title": row["session_title"],
-                        }
-                    )
+                    yield {
+                        "session_id": row[session_id_col],
+                        "session_title": row[session_title_col],
+                    }
     except FileNotFoundError:
         logger.error(f"Error: {csv_path} not found.")
     except Exception as e:
         logger.error(f"Error reading CSV: {e}")
-    return sessions_to_publish
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket for pacing API calls: short bursts up to
+    `burst` requests pass immediately, sustained load is throttled to
+    `rate_per_s`.
+    """
+
+    def __init__(self, rate_per_s=5.0, burst=10):
+        self.rate = float(rate_per_s)
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.rate,
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def wait_for_csv_update(csv_path, old_mtime, timeout_seconds=10):
+    """
+    Wait until csv_path's mtime differs from old_mtime, polling briefly.
+    Returns True once the file changed, False on timeout.
+    """
+    deadline = time.monotonic() + timeout_seconds
+    while time.monotonic() < deadline:
+        try:
+            if os.path.getmtime(csv_path) != old_mtime:
+                return True
+        except OSError:
+            pass
+        time.sleep(0.1)
+    return False
 
 
 def publish_session_with_timeout(session_id, timeout_seconds=60):
     """
     Attempt to publish a single Jules session with a specified timeout.
+
+    The timeout is enforced in-process instead of via the external
+    'timeout' command, which saves a wrapper process per session and
+    removes the GNU coreutils dependency.
     """
     logger.info(f"Publishing session: {session_id} (timeout: {timeout_seconds}s)...")
-    
+
     jules_ops_path = WORKSPACE_ROOT / JULES_OPS_SCRIPT
     command = [
-        "timeout",
-        str(timeout_seconds),
         "python3",
         str(jules_ops_path),
         "publish",
@@ -110,33 +178,41 @@ def publish_session_with_timeout(session_id, timeout_seconds=60):
     ]
 
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             command,
             cwd=str(WORKSPACE_ROOT),
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            check=False,
         )
-        
+        timed_out = False
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout_seconds)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            proc.kill()
+            # Collect whatever was written before the kill
+            stdout, stderr = proc.communicate()
+
         logger.info(f"--- Output for session {session_id} ---")
-        if result.stdout:
-            logger.info(result.stdout)
-        if result.stderr:
-            logger.error(result.stderr)
+        if stdout:
+            logger.info(stdout)
+        if stderr:
+            logger.error(stderr)
         logger.info(f"--- End Output for session {session_id} ---")
 
-        if result.returncode == 0:
-            logger.info(f"✅ Publish request for session {session_id} completed.")
-            return True
-        elif result.returncode == 124:  # Timeout exit code
+        if timed_out:
             logger.warning(f"❌ Publish request for session {session_id} timed out after {timeout_seconds} seconds.")
             return False
+        elif proc.returncode == 0:
+            logger.info(f"✅ Publish request for session {session_id} completed.")
+            return True
         else:
-            logger.error(f"❌ Publish request for session {session_id} failed with exit code {result.returncode}.")
+            logger.error(f"❌ Publish request for session {session_id} failed with exit code {proc.returncode}.")
             return False
 
     except FileNotFoundError:
-        logger.error(f"Error: '{jules_ops_path}' or 'timeout' command not found.")
+        logger.error(f"Error: '{jules_ops_path}' not found.")
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}")
     return False
@@ -151,18 +227,29 @@ def main():
         action="store_true",
         help="Regenerate consolidated_workstreams.csv before processing sessions.",
     )
-    args = parser.parse_args()
-
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=4,
+        help="Max publishes to run concurrently (default: 4).",
+    )
     args = parser.parse_args()
 
     if args.update:
+        csv_path = get_data_dir() / CONSOLIDATED_WORKSTREAMS_CSV
+        try:
+            old_mtime = os.path.getmtime(csv_path)
+        except OSError:
+            old_mtime = None
         run_jules_ops_export()
-        # Give a moment for files to be written
-        time.sleep(2)
+        # Wait for the regenerated CSV rather than sleeping a fixed 2s
+        if not wait_for_csv_update(csv_path, old_mtime):
+            logger.warning(f"{csv_path} did not change after export; using existing data.")
 
     logger.info("Collecting unpublished Jules sessions...")
 
-    sessions = get_unpublished_sessions()
+    sessions = list(get_unpublished_sessions())
 
     if not sessions:
         logger.info("No completed, unpublished sessions found.")
@@ -170,12 +257,26 @@ def main():
 
     logger.info(f"Found {len(sessions)} completed, unpublished sessions.")
 
-    for session in sessions:
+    # Pace publishes instead of sleeping a flat second after each one: a
+    # handful go out immediately, sustained load is capped at 5/s.
+    bucket = TokenBucket(rate_per_s=5, burst=10)
+
+    def publish_one(session):
         session_id = session["session_id"]
         session_title = session["session_title"]
         logger.info(f"Processing session ID: {session_id}, Title: {session_title}")
-        publish_session_with_timeout(session_id)
-        time.sleep(1)  # Small delay to prevent overwhelming the API
+        bucket.acquire()
+        return publish_session_with_timeout(session_id)
+
+    # Each publish is dominated by waiting on the Jules/GitHub APIs, so a
+    # small pool of threads overlaps that wait time across sessions.
+    workers = min(max(1, args.jobs), len(sessions))
+    if workers < 2:
+        for session in sessions:
+            publish_one(session)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(publish_one, sessions))
 
 
 if __name__ == "__main__":
@@ -13,13 +13,26 @@ SEARCH_PATHS = [
 REQUIRED_FILES = [".env.production", ".env.local"]
 
 
+def find_secret_files():
+    """
+    Maps each known filename to its source path with one directory listing
+    per search path, instead of one stat per (path, file) combination.
+    Earlier search paths win, matching the old per-file search order.
+    """
+    found = {}
+    for path in SEARCH_PATHS:
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    found.setdefault(entry.name, entry.path)
+        except OSError:
+            continue
+    return found
+
+
 def find_secret_file(filename):
     """Searches for the secret file in the configured paths."""
-    for path in SEARCH_PATHS:
-        full_path = os.path.join(path, filename)
-        if os.path.exists(full_path):
-            return full_path
-    return None
+    return find_secret_files().get(filename)
 
 
 def provision_secrets(target_worktree):
@@ -30,8 +43,9 @@ def provision_secrets(target_worktree):
     print(f"[SECRETS] Provisioning secrets for: {target_worktree}")
     success = True
 
+    available = find_secret_files()
     for fname in REQUIRED_FILES:
-        source = find_secret_file(fname)
+        source = available.get(fname)
         if not source:
             print(f"[WARN] Secret file '{fname}' not found in search paths.")
             # Don't fail hard, just warn, as some envs might not need both
@@ -39,22 +53,23 @@ def provision_secrets(target_worktree):
 
         dest = os.path.join(target_worktree, fname)
 
-        # Remove existing file/link if it exists to prevent collisions
-        if os.path.lexists(dest):
-            try:
-                os.remove(dest)
-            except OSError as e:
-                print(f"[ERROR] Could not remove existing {fname}: {e}")
-                success = False
-                continue
-
-        # Create symlink
+        # Build the link at a temp name and rename it over dest, so any
+        # reader always sees either the old link or the new one — never a
+        # missing file between remove and symlink.
+        tmp = f"{dest}.tmp.{os.getpid()}"
         try:
-            os.symlink(source, dest)
+            os.symlink(source, tmp)
+            os.replace(tmp, dest)
             print(f"[OK] Linked {fname} -> {source}")
         except Exception as e:
             print(f"[ERROR] Failed to link {fname}: {e}")
             success = False
+        finally:
+            if os.path.lexists(tmp):
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
 
     return success
 